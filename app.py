@@ -4,39 +4,176 @@ Enhanced UI, comprehensive explanations, and bug fixes
 """
 
 import gradio as gr
+from gradio.components.plot import PlotData
+from gradio.utils import get_upload_folder
+import asyncio
+import atexit
+import bisect
+import io
+import itertools
+import mmap
+import contextlib
+import functools
+import operator
+import re
+import stat
+import string
+import threading
+import time
 import logging
+import os
 import json
-import traceback
+import csv
+import hashlib
 import tempfile
+from collections import ChainMap, Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple, AsyncIterator, Callable
+from cachetools import LFUCache, LRUCache
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 
-# Import custom modules
+# Optional fast JSON encoder for exports and plot payloads
 try:
-    from cv_parser import CVParser
-    from claim_extractor import ClaimExtractor
-    from evidence_validator import EvidenceValidator
-    from red_flag_detector import RedFlagDetector
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional on-disk result cache, so repeat analyses survive restarts
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+# The analysis modules (and the Gemini SDK, PDF/DOCX parsers, aiohttp and
+# plotly behind them) are imported where first used, so the UI starts
+# without loading them
+if TYPE_CHECKING:
     from gemini_client import GeminiClient
-    from sota_checker import SOTAChecker
-    from evidence_heatmap import EvidenceHeatmap
-    from report_generator import ReportGenerator
-except ImportError as e:
-    print(f"Failed to import modules: {e}")
-    raise
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global session storage
-current_session = {
-    'initialized': False,
-    'gemini_client': None,
-    'api_key': None,
-    'last_analysis': None
-}
+@dataclass(slots=True)
+class Session:
+    """Per-user session state, held in a gr.State so users never share a client"""
+    initialized: bool = False
+    gemini_client: Optional['GeminiClient'] = None
+    key_fingerprint: Optional[str] = None
+    key_validated_at: float = 0.0
+    last_analysis: Optional[Dict] = None
+    pipelines: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    export_paths: Dict[Tuple[Any, str], Tuple[str, str]] = field(default_factory=dict)
+    visuals_shown: Any = None
+
+# Session of the request being handled; each handler binds its user's session.
+# There is deliberately no default: a shared fallback Session would leak state
+# between users, so reading it unbound raises LookupError instead
+_session_ctx: ContextVar[Session] = ContextVar('session')
+
+# How long a successfully tested API key skips the test call on re-init
+KEY_VALIDATION_TTL = 3600
+
+# Claim fields included in the CSV export
+CSV_EXPORT_COLUMNS = ['claim_text', 'category', 'verifiability_level', 'evidence_present']
+
+# Concurrent events Gradio's queue runs per handler (default 1); analyses
+# spend most of their time waiting on Gemini, so many can share the process
+QUEUE_CONCURRENCY = int(os.getenv('QUEUE_CONCURRENCY', '16'))
+
+# Batch runs analyze several resumes each, so fewer run side by side
+BATCH_CONCURRENCY = int(os.getenv('BATCH_CONCURRENCY', '2'))
+
+# Events waiting beyond this are rejected instead of queueing indefinitely
+QUEUE_MAX_SIZE = int(os.getenv('QUEUE_MAX_SIZE', '64'))
+
+# Encoder behind plotly's to_json for the Visual Analytics payloads
+PLOT_JSON_ENGINE = 'orjson' if HAS_ORJSON else 'json'
+
+# Responses smaller than this are sent uncompressed
+GZIP_MIN_SIZE = 1024
+
+# Analysis settings offered in the UI; the lowercase frozensets validate
+# handler input, which API clients can send without going through the UI
+SENIORITY_LEVELS = ("Intern", "Junior", "Mid", "Senior", "Lead")
+STRICTNESS_LEVELS = ("Low", "Medium", "High")
+VALID_SENIORITY = frozenset(level.lower() for level in SENIORITY_LEVELS)
+VALID_STRICTNESS = frozenset(level.lower() for level in STRICTNESS_LEVELS)
+
+# Upload limits; Gradio rejects larger bodies before they reach a handler
+MAX_UPLOAD_SIZE = 20 * 1024 * 1024
+SUPPORTED_UPLOAD_TYPES = frozenset({'.pdf', '.docx', '.txt'})
+MAX_BATCH_FILES = 20
+
+# Outputs after the status message when an analysis stops early; error paths
+# return these directly and never reach the render helpers
+_ERROR_OUTPUT_PADDING = (None, None, None, None, "", "", "", "")
+
+# Columns of the batch analysis summary table
+BATCH_SUMMARY_COLUMNS = ["File", "Final Score", "Risk", "Claims", "Red Flags", "Recommendation"]
+
+# Exports are written inside Gradio's file cache, so serving them skips the
+# re-hash and copy Gradio applies to files returned from outside it
+EXPORT_DIR = os.path.join(get_upload_folder(), 'exports')
+
+# Exports older than this are removed on the next export and at exit
+EXPORT_MAX_AGE = 3600
+
+# Export files are written through a 256 KiB buffer, so a typical report is
+# flushed in a single write
+EXPORT_WRITE_BUFFER = 256 * 1024
+
+# Completed analyses keyed by file hash and analysis settings
+RESULT_CACHE = LFUCache(maxsize=512)
+
+# Second-level copy of RESULT_CACHE on disk (needs diskcache). Entries hold
+# the parsed resume text and are unpickled on read, so the directory must be
+# private to the user running the app
+RESULT_CACHE_DIR = os.environ.get('RESULT_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'aitf-results'))
+RESULT_CACHE_TTL = 3600
+
+def open_disk_result_cache(path: str) -> Optional['diskcache.Cache']:
+    """
+    Open the disk result cache in a private directory
+
+    The directory is created with mode 0700. An existing directory that is a
+    symlink, belongs to another user or is open to group/others is refused,
+    since whoever controls it controls what gets unpickled.
+
+    Returns:
+        The cache, or None when diskcache is missing or the directory is unsafe
+    """
+    if not HAS_DISKCACHE:
+        return None
+
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        info = os.lstat(path)
+        if not stat.S_ISDIR(info.st_mode):
+            raise OSError("not a directory")
+        if hasattr(os, 'getuid') and (info.st_uid != os.getuid() or info.st_mode & 0o077):
+            raise OSError("directory must be owned by this user with mode 0700")
+        return diskcache.Cache(path)
+    except Exception as e:
+        logger.warning("Disk result cache disabled (%s): %s", path, e)
+        return None
+
+DISK_RESULT_CACHE = open_disk_result_cache(RESULT_CACHE_DIR)
+
+# Rendered export documents keyed by analysis version and renderer. LRU so
+# the analysis being viewed is the last evicted; the sync export and
+# visualization handlers share it across Gradio worker threads, hence the lock
+RENDER_CACHE = LRUCache(maxsize=32)
+_render_cache_lock = threading.Lock()
+
+# In-flight analyses, so identical concurrent uploads share one pipeline run
+_pending_analyses: Dict[str, asyncio.Future] = {}
 
 def initialize_session(api_key: str, mock_mode: bool = False) -> Tuple[bool, str]:
     """
@@ -49,14 +186,24 @@ def initialize_session(api_key: str, mock_mode: bool = False) -> Tuple[bool, str
     Returns:
         Tuple of (success, message)
     """
-    global current_session
+    session = _session_ctx.get()
 
     try:
         if not api_key or api_key.strip() == "":
             return False, "❌ Please enter a valid API key"
 
+        # Re-initializing with a recently tested key keeps the existing client
+        # (and its response cache) instead of repeating the test round-trip
+        key_fingerprint = hashlib.sha256(api_key.strip().encode()).hexdigest()
+        if (session.initialized
+                and session.key_fingerprint == key_fingerprint
+                and time.time() - session.key_validated_at < KEY_VALIDATION_TTL):
+            logger.info("API key validated recently, reusing Gemini client")
+            return True, "✅ Session initialized successfully! You can now upload and analyze resumes."
+
         # Initialize Gemini client
         logger.info("Initializing Gemini client...")
+        from gemini_client import GeminiClient
         gemini_client = GeminiClient(api_key=api_key.strip())
 
         # Test connection
@@ -68,47 +215,154 @@ def initialize_session(api_key: str, mock_mode: bool = False) -> Tuple[bool, str
         if not test_response or not test_response.text:
             return False, "❌ Failed to connect to Gemini API"
 
-        # Store in session
-        current_session['gemini_client'] = gemini_client
-        current_session['api_key'] = api_key
-        current_session['initialized'] = True
+        # Start a fresh session for this user
+        _session_ctx.set(Session(
+            initialized=True,
+            gemini_client=gemini_client,
+            key_fingerprint=key_fingerprint,
+            key_validated_at=time.time()
+        ))
 
         logger.info("Session initialized successfully")
         return True, "✅ Session initialized successfully! You can now upload and analyze resumes."
 
     except Exception as e:
-        logger.error(f"Session initialization failed: {e}")
+        logger.error("Session initialization failed: %s", e)
         return False, f"❌ Initialization failed: {str(e)}\n\nPlease check your API key at https://makersuite.google.com/app/apikey"
 
-def generate_comprehensive_analysis_display(analysis_results: Dict) -> str:
-    """Generate comprehensive analysis display with all factors we consider"""
+def start_session(api_key: str, mock_mode: bool, session: Session) -> Tuple[str, Session]:
+    """
+    Gradio handler for the initialize button
 
-    # Fix consistency score if it exceeds 100
-    consistency_score = min(100, analysis_results.get('consistency_score', 0))
-    analysis_results['consistency_score'] = consistency_score
+    Args:
+        api_key: Google AI API key
+        mock_mode: Use mock mode for testing (not implemented)
+        session: The user's current session from gr.State
 
-    display = f"""
-<div style="font-family: 'Segoe UI', Arial, sans-serif;">
+    Returns:
+        Tuple of (status message, session to store back in gr.State)
+    """
+    _session_ctx.set(session)
+    _, message = initialize_session(api_key, mock_mode)
+    return message, _session_ctx.get()
+
+def get_pipeline(strictness_level: str) -> Dict[str, Any]:
+    """
+    Get the analysis components for a strictness level
+
+    Components are built once per session client and strictness level and
+    reused across requests, so their caches and thread pools are shared
+    instead of being recreated for every upload.
+
+    Args:
+        strictness_level: Red flag strictness (low, medium, high)
+
+    Returns:
+        Dict with cv_parser, claim_extractor, evidence_validator and red_flag_detector
+    """
+    session = _session_ctx.get()
+    pipelines = session.pipelines
+    pipeline = pipelines.get(strictness_level)
+
+    if pipeline is None:
+        from cv_parser import CVParser
+        from claim_extractor import ClaimExtractor
+        from evidence_validator import EvidenceValidator
+        from red_flag_detector import RedFlagDetector
+
+        gemini_client = session.gemini_client
+        pipeline = pipelines[strictness_level] = {
+            'cv_parser': CVParser(),
+            'claim_extractor': ClaimExtractor(gemini_client),
+            'evidence_validator': EvidenceValidator(gemini_client),
+            'red_flag_detector': RedFlagDetector(gemini_client, strictness_level=strictness_level),
+        }
+
+    return pipeline
+
+# Styles of the rendered analysis HTML. They ship once with the Blocks CSS, so
+# each render carries short class names instead of repeated inline styles
+_RENDER_CSS = """
+.aitf-report { font-family: 'Segoe UI', Arial, sans-serif; }
+.aitf-card-overall {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white; padding: 20px; border-radius: 10px; margin: 20px 0;
+}
+.aitf-card-overall h2 { color: white !important; margin: 0; }
+.aitf-metrics {
+    display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+    gap: 20px; margin-top: 20px;
+}
+.aitf-metric { text-align: center; }
+.aitf-metric-value { font-size: 48px; font-weight: bold; }
+.aitf-metric-label { font-size: 24px; font-weight: bold; padding: 12px 0; }
+.aitf-flag-ok, .aitf-flag-critical, .aitf-flag-high, .aitf-flag-medium {
+    border-left: 4px solid; padding: 15px; margin: 15px 0;
+}
+.aitf-flag-ok { background: #e8f5e9; border-color: #4CAF50; }
+.aitf-flag-ok > h3 { color: #2e7d32 !important; }
+.aitf-flag-critical { background: #ffebee; border-color: #f44336; }
+.aitf-flag-critical > h3 { color: #c62828 !important; }
+.aitf-flag-high { background: #fff3e0; border-color: #ff9800; }
+.aitf-flag-high > h3 { color: #e65100 !important; }
+.aitf-flag-medium { background: #fffde7; border-color: #ffc107; }
+.aitf-flag-medium > h3 { color: #f57c00 !important; }
+.aitf-flag { margin: 10px 0; padding: 10px; background: rgba(255,255,255,0.5); border-radius: 5px; }
+.aitf-flag h4, .aitf-flag ul { margin: 5px 0; }
+.aitf-probe { background: #f5f5f5; padding: 8px; border-radius: 3px; margin: 5px 0; }
+.aitf-question { margin: 15px 0; padding: 15px; background: white; border-radius: 5px; }
+.aitf-question-primary, .aitf-question-followup { padding: 10px; margin: 10px 0; border-radius: 3px; }
+.aitf-question-primary { background: #f5f5f5; }
+.aitf-question-followup { background: #e3f2fd; }
+.aitf-question-followup ul { margin: 5px 0; }
+.aitf-purpose { color: #666; font-size: 0.9em; }
+"""
+
+# Blocks stylesheet and page header, built once at import
+_CUSTOM_CSS = """
+.gradio-container {
+    font-family: 'Segoe UI', Arial, sans-serif !important;
+}
+.main-title {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 30px;
+    border-radius: 10px;
+    text-align: center;
+    margin-bottom: 20px;
+}
+""" + _RENDER_CSS
+
+_TITLE_HTML = """
+<div class="main-title">
+    <h1>🔍 Resume Verification System - Professional Edition</h1>
+    <p>Comprehensive AI-powered analysis with full transparency and interpretability</p>
+</div>
+"""
+
+# Markdown/HTML layout of the analysis tab, rendered with str.format_map
+_ANALYSIS_DISPLAY_TEMPLATE = """
+<div class="aitf-report">
 
 # 📊 Comprehensive Resume Analysis
 
-<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; margin: 20px 0;">
-    <h2 style="color: white; margin: 0;">Overall Assessment</h2>
-    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 20px; margin-top: 20px;">
-        <div style="text-align: center;">
-            <div style="font-size: 48px; font-weight: bold;">{analysis_results['final_score']:.1f}</div>
+<div class="aitf-card-overall">
+    <h2>Overall Assessment</h2>
+    <div class="aitf-metrics">
+        <div class="aitf-metric">
+            <div class="aitf-metric-value">{final_score:.1f}</div>
             <div>Final Score</div>
         </div>
-        <div style="text-align: center;">
-            <div style="font-size: 48px; font-weight: bold;">{analysis_results['credibility_score']:.1f}</div>
+        <div class="aitf-metric">
+            <div class="aitf-metric-value">{credibility_score:.1f}</div>
             <div>Credibility</div>
         </div>
-        <div style="text-align: center;">
-            <div style="font-size: 48px; font-weight: bold;">{consistency_score:.1f}</div>
+        <div class="aitf-metric">
+            <div class="aitf-metric-value">{consistency_score:.1f}</div>
             <div>Consistency</div>
         </div>
-        <div style="text-align: center;">
-            <div style="font-size: 24px; font-weight: bold; padding: 12px 0;">{analysis_results['risk_assessment'].upper()}</div>
+        <div class="aitf-metric">
+            <div class="aitf-metric-label">{risk_level}</div>
             <div>Risk Level</div>
         </div>
     </div>
@@ -119,72 +373,194 @@ def generate_comprehensive_analysis_display(analysis_results: Dict) -> str:
 <div style="background: #f8f9fa; border-left: 4px solid #4CAF50; padding: 15px; margin: 15px 0;">
 
 ### ✅ Document Quality Metrics
-- **Total Claims Extracted:** {analysis_results['total_claims']} factual claims identified
-- **Claims with Evidence:** {analysis_results['verified_claims']} ({analysis_results['verified_claims']/max(1, analysis_results['total_claims'])*100:.0f}%)
-- **Unsupported Claims:** {analysis_results['unverified_claims']} ({analysis_results['unverified_claims']/max(1, analysis_results['total_claims'])*100:.0f}%)
-- **Document Structure:** {analysis_results.get('structure_quality', 'Well-organized')}
+- **Total Claims Extracted:** {total_claims} factual claims identified
+- **Claims with Evidence:** {verified_claims} ({verified_pct:.0f}%)
+- **Unsupported Claims:** {unverified_claims} ({unverified_pct:.0f}%)
+- **Document Structure:** {structure_quality}
 
 ### 📈 Claim Quality Analysis
-- **Specificity Score:** {analysis_results.get('claim_metrics', {}).get('specificity_score', 0)*100:.0f}% (How specific vs vague)
-- **Claims with Metrics:** {analysis_results.get('claim_metrics', {}).get('claims_with_metrics', 0)}/{analysis_results['total_claims']}
-- **Claims with Artifacts:** {analysis_results.get('claim_metrics', {}).get('claims_with_artifacts', 0)}/{analysis_results['total_claims']}
-- **Buzzword Density:** {analysis_results.get('claim_metrics', {}).get('buzzword_density', 0)*100:.1f}% {get_buzzword_interpretation(analysis_results.get('claim_metrics', {}).get('buzzword_density', 0))}
+- **Specificity Score:** {specificity_pct:.0f}% (How specific vs vague)
+- **Claims with Metrics:** {claims_with_metrics}/{total_claims}
+- **Claims with Artifacts:** {claims_with_artifacts}/{total_claims}
+- **Buzzword Density:** {buzzword_pct:.1f}% {buzzword_interpretation}
 
 ### 🔗 Evidence Validation Results
-- **Direct Evidence Found:** {count_evidence_type(analysis_results, 'direct')} claims
-- **Contextual Evidence:** {count_evidence_type(analysis_results, 'contextual')} claims
-- **No Evidence:** {count_evidence_type(analysis_results, 'none')} claims
-- **Link Verification:** {analysis_results.get('links_checked', 0)} URLs checked
+- **Direct Evidence Found:** {direct_evidence} claims
+- **Contextual Evidence:** {contextual_evidence} claims
+- **No Evidence:** {no_evidence} claims
+- **Link Verification:** {links_checked} URLs checked
 
 ### 🎯 Advanced Checks Performed
-- **Timeline Consistency:** {get_timeline_status(analysis_results)}
-- **Technology Timeline:** {get_tech_timeline_status(analysis_results)}
-- **Role-Achievement Match:** {get_role_match_status(analysis_results)}
-- **Skill Usage Verification:** {get_skill_usage_status(analysis_results)}
-- **Metric Plausibility:** {get_metric_status(analysis_results)}
+- **Timeline Consistency:** {timeline_status}
+- **Technology Timeline:** {tech_timeline_status}
+- **Role-Achievement Match:** {role_match_status}
+- **Skill Usage Verification:** {skill_usage_status}
+- **Metric Plausibility:** {metric_status}
 
 </div>
 
 ## 🚩 Red Flag Analysis
 
-{generate_detailed_red_flag_analysis(analysis_results.get('red_flags', []))}
+{red_flag_analysis}
 
 ## 💡 Score Calculation Breakdown
 
-{generate_score_calculation_details(analysis_results)}
+{score_details}
 
 ## 📋 Final Recommendation
 
 <div style="background: #e3f2fd; border-left: 4px solid #2196F3; padding: 15px; margin: 15px 0;">
-<strong>{analysis_results['recommendation']}</strong>
+<strong>{recommendation}</strong>
 
-Based on {analysis_results['total_claims']} claims analyzed with {analysis_results.get('total_red_flags', 0)} red flags detected.
+Based on {total_claims} claims analyzed with {total_red_flags} red flags detected.
 </div>
 
 </div>
 """
-    return display
+
+def generate_comprehensive_analysis_display(analysis_results: Dict) -> str:
+    """Generate comprehensive analysis display with all factors we consider"""
+
+    consistency_score = analysis_results.get('consistency_score', 0)
+
+    # Bucket the red flags once for the status helpers below
+    flag_index = get_flag_index(analysis_results)
+
+    # Derive every displayed value once, then fill the precompiled layout
+    total_claims = analysis_results['total_claims']
+    claim_total = max(1, total_claims)
+    claim_metrics = analysis_results.get('claim_metrics', {})
+    buzzword_density = claim_metrics.get('buzzword_density', 0)
+
+    return _ANALYSIS_DISPLAY_TEMPLATE.format_map({
+        'final_score': analysis_results['final_score'],
+        'credibility_score': analysis_results['credibility_score'],
+        'consistency_score': consistency_score,
+        'risk_level': analysis_results['risk_assessment'].upper(),
+        'total_claims': total_claims,
+        'verified_claims': analysis_results['verified_claims'],
+        'verified_pct': analysis_results['verified_claims'] / claim_total * 100,
+        'unverified_claims': analysis_results['unverified_claims'],
+        'unverified_pct': analysis_results['unverified_claims'] / claim_total * 100,
+        'structure_quality': analysis_results.get('structure_quality', 'Well-organized'),
+        'specificity_pct': claim_metrics.get('specificity_score', 0) * 100,
+        'claims_with_metrics': claim_metrics.get('claims_with_metrics', 0),
+        'claims_with_artifacts': claim_metrics.get('claims_with_artifacts', 0),
+        'buzzword_pct': buzzword_density * 100,
+        'buzzword_interpretation': get_buzzword_interpretation(buzzword_density),
+        'direct_evidence': count_evidence_type(analysis_results, 'direct'),
+        'contextual_evidence': count_evidence_type(analysis_results, 'contextual'),
+        'no_evidence': count_evidence_type(analysis_results, 'none'),
+        'links_checked': analysis_results.get('links_checked', 0),
+        'timeline_status': get_timeline_status(analysis_results),
+        'tech_timeline_status': get_tech_timeline_status(analysis_results),
+        'role_match_status': get_role_match_status(analysis_results),
+        'skill_usage_status': get_skill_usage_status(analysis_results),
+        'metric_status': get_metric_status(analysis_results),
+        'red_flag_analysis': generate_detailed_red_flag_analysis(analysis_results.get('red_flags', []), flag_index),
+        'score_details': generate_score_calculation_details(analysis_results),
+        'recommendation': analysis_results['recommendation'],
+        'total_red_flags': analysis_results.get('total_red_flags', 0),
+    })
+
+# Buzzword density band upper bounds and the label for each band
+_BUZZWORD_THRESHOLDS = (0.02, 0.05, 0.10)
+_BUZZWORD_LABELS = (
+    "✅ Excellent - Concrete language",
+    "✅ Good - Mostly specific",
+    "⚠️ Moderate - Some vagueness",
+    "❌ High - Too many buzzwords",
+)
 
 def get_buzzword_interpretation(density: float) -> str:
     """Interpret buzzword density"""
-    if density < 0.02:
-        return "✅ Excellent - Concrete language"
-    elif density < 0.05:
-        return "✅ Good - Mostly specific"
-    elif density < 0.10:
-        return "⚠️ Moderate - Some vagueness"
+    return _BUZZWORD_LABELS[bisect.bisect_right(_BUZZWORD_THRESHOLDS, density)]
+
+def normalize_score(score: float) -> float:
+    """Normalize score to 0-100 range"""
+    if score > 100:
+        # Score was mistakenly multiplied
+        return min(100, score / 100)
+    elif score <= 1:
+        # Score is in decimal format (0-1)
+        return score * 100
     else:
-        return "❌ High - Too many buzzwords"
+        # Score is already in 0-100 range
+        return min(100, score)
+
+def summarize_claims(claims: List[Dict], validations: List[Dict]) -> Dict[str, Any]:
+    """
+    Tally claim and validation statistics in a single pass
+
+    validations[i] is the validation of claims[i], as compiled by
+    EvidenceValidator, so both lists are walked together.
+
+    Returns:
+        Dict with status_counts and evidence_counts Counters and links_checked
+    """
+    status_counts = Counter()
+    evidence_counts = Counter()
+    links_checked = 0
+
+    for claim, validation in zip(claims, validations):
+        status_counts[validation.get('verification_status')] += 1
+        evidence_counts[validation.get('evidence_present')] += 1
+        if claim.get('links_artifacts'):
+            links_checked += 1
+
+    return {
+        'status_counts': status_counts,
+        'evidence_counts': evidence_counts,
+        'links_checked': links_checked
+    }
 
 def count_evidence_type(results: Dict, evidence_type: str) -> int:
     """Count claims with specific evidence type"""
-    validations = results.get('validations', [])
-    return sum(1 for v in validations if v.get('evidence_present') == evidence_type)
+    evidence_counts = results.get('_evidence_counts')
+    if evidence_counts is None:
+        evidence_counts = results['_evidence_counts'] = Counter(
+            v.get('evidence_present') for v in results.get('validations', [])
+        )
+    return evidence_counts[evidence_type]
+
+# RedFlagDetector fills these fields on every flag it emits
+_FLAG_INDEX_FIELDS = operator.itemgetter('severity', 'category', 'description')
+
+def build_flag_index(red_flags: List[Dict]) -> Dict[str, Any]:
+    """
+    Bucket red flags by severity and category in a single pass
+
+    Returns:
+        Dict with by_severity and by_category lists plus tech_flags, the
+        flags whose description mentions a technology
+    """
+    by_severity = defaultdict(list)
+    by_category = defaultdict(list)
+    tech_flags = []
+
+    for flag in red_flags:
+        severity, category, description = _FLAG_INDEX_FIELDS(flag)
+        by_severity[severity].append(flag)
+        by_category[category].append(flag)
+        if 'tech' in description.lower():
+            tech_flags.append(flag)
+
+    return {
+        'by_severity': dict(by_severity),
+        'by_category': dict(by_category),
+        'tech_flags': tech_flags
+    }
+
+def get_flag_index(results: Dict) -> Dict[str, Any]:
+    """Get the red flag index for results, building and storing it if missing"""
+    flag_index = results.get('_flag_index')
+    if flag_index is None:
+        flag_index = results['_flag_index'] = build_flag_index(results.get('red_flags', []))
+    return flag_index
 
 def get_timeline_status(results: Dict) -> str:
     """Get timeline consistency status"""
-    red_flags = results.get('red_flags', [])
-    timeline_issues = [f for f in red_flags if f.get('category') == 'timeline']
+    timeline_issues = get_flag_index(results)['by_category'].get('timeline', ())
     if not timeline_issues:
         return "✅ Consistent - No gaps or overlaps"
     else:
@@ -192,8 +568,7 @@ def get_timeline_status(results: Dict) -> str:
 
 def get_tech_timeline_status(results: Dict) -> str:
     """Get technology timeline status"""
-    red_flags = results.get('red_flags', [])
-    tech_issues = [f for f in red_flags if 'tech' in f.get('description', '').lower()]
+    tech_issues = get_flag_index(results)['tech_flags']
     if not tech_issues:
         return "✅ Valid - All technologies used after release"
     else:
@@ -201,8 +576,7 @@ def get_tech_timeline_status(results: Dict) -> str:
 
 def get_role_match_status(results: Dict) -> str:
     """Get role-achievement match status"""
-    red_flags = results.get('red_flags', [])
-    mismatch_issues = [f for f in red_flags if f.get('category') == 'mismatch']
+    mismatch_issues = get_flag_index(results)['by_category'].get('mismatch', ())
     if not mismatch_issues:
         return "✅ Aligned - Achievements match role level"
     else:
@@ -218,121 +592,122 @@ def get_skill_usage_status(results: Dict) -> str:
 
 def get_metric_status(results: Dict) -> str:
     """Get metric plausibility status"""
-    red_flags = results.get('red_flags', [])
-    implausible = [f for f in red_flags if f.get('category') == 'implausible']
+    implausible = get_flag_index(results)['by_category'].get('implausible', ())
     if not implausible:
         return "✅ Plausible - Metrics within norms"
     else:
         return f"❌ {len(implausible)} unrealistic claims"
 
-def generate_detailed_red_flag_analysis(red_flags: List[Dict]) -> str:
-    """Generate detailed red flag analysis with better UI"""
-    if not red_flags:
-        return """
-<div style="background: #e8f5e9; border-left: 4px solid #4CAF50; padding: 15px; margin: 15px 0;">
-<h3 style="color: #2e7d32;">✅ No Critical Issues Detected</h3>
+_NO_RED_FLAGS_HTML = """
+<div class="aitf-flag-ok">
+<h3>✅ No Critical Issues Detected</h3>
 <p>The resume appears internally consistent with reasonable claims.</p>
 </div>
 """
 
-    # Group by severity
-    critical = [f for f in red_flags if f.get('severity') == 'critical']
-    high = [f for f in red_flags if f.get('severity') == 'high']
-    medium = [f for f in red_flags if f.get('severity') == 'medium']
-    low = [f for f in red_flags if f.get('severity') == 'low']
-
-    html = ""
-
-    if critical:
-        html += """
-<div style="background: #ffebee; border-left: 4px solid #f44336; padding: 15px; margin: 15px 0;">
-<h3 style="color: #c62828;">🔴 Critical Issues ({count})</h3>
-""".format(count=len(critical))
-        for flag in critical:
-            html += generate_single_flag_html(flag)
-        html += "</div>"
-
-    if high:
-        html += """
-<div style="background: #fff3e0; border-left: 4px solid #ff9800; padding: 15px; margin: 15px 0;">
-<h3 style="color: #e65100;">🟠 High Priority Issues ({count})</h3>
-""".format(count=len(high))
-        for flag in high:
-            html += generate_single_flag_html(flag)
-        html += "</div>"
-
-    if medium:
-        html += """
-<div style="background: #fffde7; border-left: 4px solid #ffc107; padding: 15px; margin: 15px 0;">
-<h3 style="color: #f57c00;">🟡 Medium Priority Issues ({count})</h3>
-""".format(count=len(medium))
-        for flag in medium[:3]:  # Limit to top 3
-            html += generate_single_flag_html(flag)
-        html += "</div>"
-
-    return html
+# (severity, section header, max flags shown) in display order
+_RED_FLAG_SECTIONS = (
+    ('critical', """
+<div class="aitf-flag-critical">
+<h3>🔴 Critical Issues ({count})</h3>
+""", None),
+    ('high', """
+<div class="aitf-flag-high">
+<h3>🟠 High Priority Issues ({count})</h3>
+""", None),
+    ('medium', """
+<div class="aitf-flag-medium">
+<h3>🟡 Medium Priority Issues ({count})</h3>
+""", 3),  # Limit to top 3
+)
+
+def generate_detailed_red_flag_analysis(red_flags: List[Dict], flag_index: Optional[Dict] = None) -> str:
+    """Generate detailed red flag analysis with better UI"""
+    if not red_flags:
+        return _NO_RED_FLAGS_HTML
 
-def generate_single_flag_html(flag: Dict) -> str:
-    """Generate HTML for a single red flag with detailed explanation"""
-    category_explanations = {
-        'vague': {
-            'icon': '💭',
-            'why': 'Vague claims without specifics are common in padded resumes',
-            'impact': 'Cannot verify actual expertise level',
-            'action': 'Request specific examples with metrics'
-        },
-        'timeline': {
-            'icon': '📅',
-            'why': 'Timeline inconsistencies suggest potential fabrication',
-            'impact': 'Questions overall resume credibility',
-            'action': 'Verify exact dates with references'
-        },
-        'implausible': {
-            'icon': '📊',
-            'why': 'Claims exceeding industry norms need strong evidence',
-            'impact': 'Likely exaggeration or misrepresentation',
-            'action': 'Request detailed methodology and proof'
-        },
-        'mismatch': {
-            'icon': '⚖️',
-            'why': 'Achievements should match role seniority',
-            'impact': 'Suggests overclaiming or title inflation',
-            'action': 'Explore actual responsibilities and authority'
-        },
-        'overclaim': {
-            'icon': '👥',
-            'why': 'Taking sole credit for team work is concerning',
-            'impact': 'Questions integrity and teamwork',
-            'action': 'Ask about team composition and individual contribution'
-        }
+    # Group by severity
+    by_severity = (flag_index or build_flag_index(red_flags))['by_severity']
+
+    html = io.StringIO()
+
+    for severity, header, limit in _RED_FLAG_SECTIONS:
+        flags = by_severity.get(severity)
+        if flags:
+            html.write(header.format(count=len(flags)))
+            for flag in flags[:limit]:
+                html.write(generate_single_flag_html(flag))
+            html.write("</div>")
+
+    return html.getvalue()
+
+_FLAG_CATEGORY_EXPLANATIONS = {
+    'vague': {
+        'icon': '💭',
+        'why': 'Vague claims without specifics are common in padded resumes',
+        'impact': 'Cannot verify actual expertise level',
+        'action': 'Request specific examples with metrics'
+    },
+    'timeline': {
+        'icon': '📅',
+        'why': 'Timeline inconsistencies suggest potential fabrication',
+        'impact': 'Questions overall resume credibility',
+        'action': 'Verify exact dates with references'
+    },
+    'implausible': {
+        'icon': '📊',
+        'why': 'Claims exceeding industry norms need strong evidence',
+        'impact': 'Likely exaggeration or misrepresentation',
+        'action': 'Request detailed methodology and proof'
+    },
+    'mismatch': {
+        'icon': '⚖️',
+        'why': 'Achievements should match role seniority',
+        'impact': 'Suggests overclaiming or title inflation',
+        'action': 'Explore actual responsibilities and authority'
+    },
+    'overclaim': {
+        'icon': '👥',
+        'why': 'Taking sole credit for team work is concerning',
+        'impact': 'Questions integrity and teamwork',
+        'action': 'Ask about team composition and individual contribution'
     }
+}
 
-    cat_info = category_explanations.get(flag.get('category', ''), {
-        'icon': '⚠️',
-        'why': 'This pattern needs verification',
-        'impact': 'May affect credibility',
-        'action': 'Verify during interview'
-    })
+_DEFAULT_FLAG_EXPLANATION = {
+    'icon': '⚠️',
+    'why': 'This pattern needs verification',
+    'impact': 'May affect credibility',
+    'action': 'Verify during interview'
+}
 
-    return f"""
-<div style="margin: 10px 0; padding: 10px; background: rgba(255,255,255,0.5); border-radius: 5px;">
-    <h4 style="margin: 5px 0;">{cat_info['icon']} {flag.get('description', 'Issue detected')}</h4>
-    <ul style="margin: 5px 0;">
-        <li><strong>Why this matters:</strong> {cat_info['why']}</li>
-        <li><strong>Impact:</strong> {cat_info['impact']}</li>
-        <li><strong>Action needed:</strong> {cat_info['action']}</li>
+_FLAG_TEMPLATE = """
+<div class="aitf-flag">
+    <h4>{icon} {description}</h4>
+    <ul>
+        <li><strong>Why this matters:</strong> {why}</li>
+        <li><strong>Impact:</strong> {impact}</li>
+        <li><strong>Action needed:</strong> {action}</li>
     </ul>
-    <p style="background: #f5f5f5; padding: 8px; border-radius: 3px; margin: 5px 0;">
-        <strong>Interview Question:</strong> {flag.get('interview_probe', 'Verify this claim in detail')}
+    <p class="aitf-probe">
+        <strong>Interview Question:</strong> {interview_probe}
     </p>
 </div>
 """
 
+def generate_single_flag_html(flag: Dict) -> str:
+    """Generate HTML for a single red flag with detailed explanation"""
+    cat_info = _FLAG_CATEGORY_EXPLANATIONS.get(flag.get('category', ''), _DEFAULT_FLAG_EXPLANATION)
+
+    return _FLAG_TEMPLATE.format_map(ChainMap({
+        'description': flag.get('description', 'Issue detected'),
+        'interview_probe': flag.get('interview_probe', 'Verify this claim in detail')
+    }, cat_info))
+
 def generate_score_calculation_details(results: Dict) -> str:
     """Generate detailed score calculation breakdown"""
 
-    # Ensure consistency score doesn't exceed 100
-    consistency_score = min(100, results.get('consistency_score', 0))
+    consistency_score = results.get('consistency_score', 0)
 
     html = f"""
 <div style="background: #f5f5f5; padding: 20px; border-radius: 10px; margin: 20px 0;">
@@ -436,26 +811,20 @@ def generate_score_calculation_details(results: Dict) -> str:
 
 def get_check_status(results: Dict, check_type: str) -> str:
     """Get status for specific check"""
-    red_flags = results.get('red_flags', [])
+    flag_index = get_flag_index(results)
 
     if check_type == 'timeline':
-        issues = [f for f in red_flags if f.get('category') == 'timeline']
+        issues = flag_index['by_category'].get('timeline')
         return "❌ Failed" if issues else "✅ Passed"
     elif check_type == 'tech_timeline':
-        issues = [f for f in red_flags if 'tech' in f.get('description', '').lower()]
+        issues = flag_index['tech_flags']
         return "❌ Failed" if issues else "✅ Passed"
     elif check_type == 'skill_usage':
         return "⚠️ Partial"
     else:
         return "✅ Passed"
 
-def generate_enhanced_claim_analysis(claims: List[Dict], validations: List[Dict]) -> str:
-    """Generate enhanced claim-by-claim analysis with better UI"""
-
-    if not claims:
-        return "<p>No claims found to analyze.</p>"
-
-    html = """
+_CLAIM_ANALYSIS_HEADER = """
 <div style="font-family: 'Segoe UI', Arial, sans-serif;">
 
 # 📋 Detailed Claim Analysis
@@ -464,47 +833,47 @@ def generate_enhanced_claim_analysis(claims: List[Dict], validations: List[Dict]
 <p><strong>Analyzing {total} claims for evidence and credibility...</strong></p>
 </div>
 
-""".format(total=len(claims))
+"""
+
+_CLAIM_CATEGORY_ICONS = {
+    'work_experience': '💼',
+    'project': '🚀',
+    'skill': '🛠️',
+    'research': '🔬',
+    'education': '🎓'
+}
+
+def generate_enhanced_claim_analysis(claims: List[Dict], validations: List[Dict]) -> str:
+    """Generate enhanced claim-by-claim analysis with better UI"""
+
+    if not claims:
+        return "<p>No claims found to analyze.</p>"
+
+    html = io.StringIO()
+    html.write(_CLAIM_ANALYSIS_HEADER.format(total=len(claims)))
 
     # Create validation map by claim_id for proper matching
-    validation_map = {}
-    for val in validations:
-        claim_id = val.get('claim_id', '')
-        if claim_id:
-            validation_map[claim_id] = val
+    validation_map = {v['claim_id']: v for v in validations if v.get('claim_id')}
 
-    # Group claims by category
+    # Group claims by category, keeping first-appearance order
     categories = {}
     for claim in claims[:20]:  # Limit to top 20
-        cat = claim.get('category', 'other')
-        if cat not in categories:
-            categories[cat] = []
-
-        # Get validation by claim_id
-        claim_id = claim.get('claim_id', '')
-        validation = validation_map.get(claim_id, {})
-        categories[cat].append((claim, validation))
+        categories.setdefault(claim.get('category', 'other'), []).append(claim)
 
     # Display by category
-    category_icons = {
-        'work_experience': '💼',
-        'project': '🚀',
-        'skill': '🛠️',
-        'research': '🔬',
-        'education': '🎓'
-    }
-
     for category, items in categories.items():
-        icon = category_icons.get(category, '📌')
-        html += f"""
+        icon = _CLAIM_CATEGORY_ICONS.get(category, '📌')
+        html.write(f"""
 <h2>{icon} {category.replace('_', ' ').title()} ({len(items)} claims)</h2>
-"""
+""")
 
-        for claim, validation in items[:5]:  # Limit to 5 per category
-            html += generate_single_claim_analysis(claim, validation)
+        # Only the displayed claims need their validation looked up
+        for claim in itertools.islice(items, 5):  # Limit to 5 per category
+            validation = validation_map.get(claim.get('claim_id', ''), {})
+            html.write(generate_single_claim_analysis(claim, validation))
 
-    html += "</div>"
-    return html
+    html.write("</div>")
+    return html.getvalue()
 
 def generate_single_claim_analysis(claim: Dict, validation: Dict) -> str:
     """Generate analysis for a single claim with detailed explanation"""
@@ -561,13 +930,13 @@ def generate_interview_guide_with_context(results: Dict) -> str:
     if not results:
         return "<p>No analysis results available yet. Please run an analysis first.</p>"
 
-    html = """
-<div style="font-family: 'Segoe UI', Arial, sans-serif;">
+    parts = ["""
+<div class="aitf-report">
 
 # 🎯 Strategic Interview Guide
 
-<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; margin: 20px 0;">
-    <h2 style="color: white; margin: 0;">Customized for {level} Level Position</h2>
+<div class="aitf-card-overall">
+    <h2>Customized for {level} Level Position</h2>
     <p>Based on {claims} claims analyzed with {flags} concerns identified</p>
 </div>
 
@@ -575,105 +944,359 @@ def generate_interview_guide_with_context(results: Dict) -> str:
         level=results.get('seniority_level', 'Mid'),
         claims=results.get('total_claims', 0),
         flags=results.get('total_red_flags', 0)
-    )
+    )]
 
     # Priority verification areas
-    html += """
+    parts.append("""
 <h2>🔴 Priority Verification Areas</h2>
-<div style="background: #ffebee; border-left: 4px solid #f44336; padding: 15px; margin: 15px 0;">
-"""
+<div class="aitf-flag-critical">
+""")
 
     red_flags = results.get('red_flags', [])
 
     if not red_flags:
-        html += "<p>✅ No critical areas identified - proceed with standard behavioral interview</p>"
+        parts.append("<p>✅ No critical areas identified - proceed with standard behavioral interview</p>")
     else:
         for i, flag in enumerate(red_flags[:5], 1):
             description = flag.get('description', 'Issue detected')
             probe = flag.get('interview_probe', 'Can you provide more details about this?')
 
-            html += f"""
-<div style="margin: 15px 0; padding: 15px; background: white; border-radius: 5px;">
+            parts.append(f"""
+<div class="aitf-question">
     <h3>Priority #{i}: {description}</h3>
 
-    <div style="background: #f5f5f5; padding: 10px; margin: 10px 0; border-radius: 3px;">
+    <div class="aitf-question-primary">
         <strong>🎤 Primary Question:</strong><br>
         {probe}
     </div>
 
-    <div style="background: #e3f2fd; padding: 10px; margin: 10px 0; border-radius: 3px;">
+    <div class="aitf-question-followup">
         <strong>💡 Follow-up Questions:</strong>
-        <ul style="margin: 5px 0;">
+        <ul>
             <li>Can you walk me through the specific details?</li>
             <li>Who else was involved and what were their roles?</li>
             <li>What evidence or documentation do you have?</li>
         </ul>
     </div>
 </div>
-"""
+""")
 
-    html += """
+    parts.append("""
 </div>
 
 <h2>✅ Standard Interview Questions</h2>
-<div style="background: #e8f5e9; border-left: 4px solid #4CAF50; padding: 15px; margin: 15px 0;">
+<div class="aitf-flag-ok">
 
-<div style="margin: 15px 0; padding: 15px; background: white; border-radius: 5px;">
+<div class="aitf-question">
     <p><strong>Q1: Walk me through your most significant technical contribution.</strong></p>
-    <p style="color: #666; font-size: 0.9em;">Purpose: Verify depth of technical involvement and ownership</p>
+    <p class="aitf-purpose">Purpose: Verify depth of technical involvement and ownership</p>
 </div>
 
-<div style="margin: 15px 0; padding: 15px; background: white; border-radius: 5px;">
+<div class="aitf-question">
     <p><strong>Q2: Describe a time when a project didn't go as planned. What happened?</strong></p>
-    <p style="color: #666; font-size: 0.9em;">Purpose: Test honesty and ability to learn from failures</p>
+    <p class="aitf-purpose">Purpose: Test honesty and ability to learn from failures</p>
 </div>
 
-<div style="margin: 15px 0; padding: 15px; background: white; border-radius: 5px;">
+<div class="aitf-question">
     <p><strong>Q3: How do you measure success in your role?</strong></p>
-    <p style="color: #666; font-size: 0.9em;">Purpose: Verify metrics-driven approach and claimed achievements</p>
+    <p class="aitf-purpose">Purpose: Verify metrics-driven approach and claimed achievements</p>
 </div>
 
 </div>
 
 </div>
-"""
+""")
 
-    return html
+    return "".join(parts)
 
-def analyze_resume(
+async def analyze_resume(
     file,
     seniority_level: str,
     strictness_level: str,
     deep_analysis: bool,
+    session: Session,
     progress=gr.Progress()
-) -> Tuple[str, Any, Any, Any, Any, str, str, str, str]:
-    """Main analysis function with enhanced outputs"""
-    global current_session
+) -> AsyncIterator[Tuple[str, Any, Any, Any, Any, str, str, str, str]]:
+    """
+    Main analysis function with enhanced outputs
 
-    if not current_session.get('initialized'):
-        return "❌ Please initialize session with API key first", None, None, None, None, "", "", "", ""
+    Runs as an async Gradio generator handler so the Gemini-bound stages can
+    overlap their independent requests with asyncio.gather, and finished
+    sections stream to the page while later stages run. Repeat uploads of
+    the same file with the same settings are served from RESULT_CACHE, and
+    concurrent identical uploads share a single pipeline run.
+    """
+    _session_ctx.set(session)
+    # Every yield below clears the plots, so the next tab select redraws them
+    session.visuals_shown = None
+
+    if not session.initialized:
+        yield error_outputs("❌ Please initialize session with API key first")
+        return
 
     if file is None:
-        return "❌ Please upload a resume file", None, None, None, None, "", "", "", ""
+        yield error_outputs("❌ Please upload a resume file")
+        return
+
+    if str(seniority_level).lower() not in VALID_SENIORITY:
+        yield error_outputs(f"❌ Invalid seniority. Must be one of: {', '.join(SENIORITY_LEVELS)}")
+        return
 
+    if str(strictness_level).lower() not in VALID_STRICTNESS:
+        yield error_outputs(f"❌ Invalid strictness. Must be one of: {', '.join(STRICTNESS_LEVELS)}")
+        return
+
+    # Get file path
+    file_path = file.name if hasattr(file, 'name') else str(file)
+
+    # Partial outputs published by the pipeline are yielded as they arrive
+    partials = asyncio.Queue()
+    analysis = asyncio.ensure_future(get_analysis(
+        file_path, seniority_level, strictness_level, deep_analysis, progress, partials.put_nowait
+    ))
+
+    next_partial = None
     try:
-        progress(0.0, desc="Initializing analysis...")
+        while not analysis.done():
+            next_partial = asyncio.ensure_future(partials.get())
+            await asyncio.wait({analysis, next_partial}, return_when=asyncio.FIRST_COMPLETED)
+            if next_partial.done():
+                session.visuals_shown = None
+                yield next_partial.result()
+            else:
+                next_partial.cancel()
+    finally:
+        # Gradio closes the generator when the client disconnects; don't leave
+        # the queue read pending
+        if next_partial is not None and not next_partial.done():
+            next_partial.cancel()
+
+    analysis_results, outputs = analysis.result()
+
+    if analysis_results is not None:
+        # Store for export; files written for the previous analysis no longer apply
+        session.last_analysis = analysis_results
+        session.export_paths.clear()
+
+    session.visuals_shown = None
+    yield outputs
+
+async def get_analysis(
+    file_path: str,
+    seniority_level: str,
+    strictness_level: str,
+    deep_analysis: bool,
+    progress,
+    publish: Optional[Callable[[Tuple], None]] = None
+) -> Tuple[Optional[Dict], Tuple[str, Any, Any, Any, Any, str, str, str, str]]:
+    """
+    Get the analysis for one uploaded file, from cache or a pipeline run
 
-        # Get file path
-        file_path = file.name if hasattr(file, 'name') else str(file)
+    Rejects unsupported or oversize files, serves repeat uploads from
+    RESULT_CACHE, and lets concurrent identical uploads share one run.
+    Only the caller that starts a run receives its partial outputs.
 
-        # Initialize modules
-        gemini_client = current_session['gemini_client']
-        cv_parser = CVParser()
-        claim_extractor = ClaimExtractor(gemini_client)
-        evidence_validator = EvidenceValidator(gemini_client)
-        red_flag_detector = RedFlagDetector(gemini_client, strictness_level=strictness_level.lower())
+    Returns:
+        Tuple of (analysis_results or None, Gradio outputs)
+    """
+    # Reject unsupported or oversize files before reading them
+    if os.path.splitext(file_path)[1].lower() not in SUPPORTED_UPLOAD_TYPES:
+        return None, error_outputs("❌ Unsupported file type. Please upload a PDF, DOCX, or TXT resume")
+
+    try:
+        if os.path.getsize(file_path) > MAX_UPLOAD_SIZE:
+            return None, error_outputs(f"❌ File too large (max {MAX_UPLOAD_SIZE // (1024 * 1024)}MB)")
+
+        digest = await asyncio.to_thread(hash_upload, file_path)
+    except OSError as e:
+        logger.error("Could not read uploaded file: %s", e)
+        return None, error_outputs(f"❌ Could not read uploaded file: {str(e)}")
+
+    cache_key = get_analysis_cache_key(digest, seniority_level, strictness_level, deep_analysis)
+    cached = RESULT_CACHE.get(cache_key)
+    if cached is None and DISK_RESULT_CACHE is not None:
+        cached = await asyncio.to_thread(load_disk_result, cache_key)
+        if cached is not None:
+            RESULT_CACHE[cache_key] = cached
+    if cached is not None:
+        progress(1.0, desc="Loaded cached analysis")
+        return cached
+
+    pending = _pending_analyses.get(cache_key)
+    if pending is None:
+        pending = asyncio.ensure_future(
+            run_analysis_pipeline(file_path, seniority_level, strictness_level, deep_analysis, progress, publish)
+        )
+        _pending_analyses[cache_key] = pending
+        pending.add_done_callback(lambda done: finish_analysis(cache_key, done))
+
+    return await asyncio.shield(pending)
+
+async def analyze_resumes_batch(
+    files,
+    seniority_level: str,
+    strictness_level: str,
+    deep_analysis: bool,
+    session: Session,
+    progress=gr.Progress()
+) -> Tuple[List[List[Any]], str]:
+    """
+    Analyze several resumes concurrently for batch screening
+
+    Each file goes through get_analysis, so batches share the result cache
+    and single-flight runs with single uploads. The runs overlap on the
+    event loop; GeminiClient's request semaphore bounds the API fan-out.
+
+    Returns:
+        Tuple of (summary table rows, status message)
+    """
+    _session_ctx.set(session)
+
+    if not session.initialized:
+        return [], "❌ Please initialize session with API key first"
+
+    if not files:
+        return [], "❌ Please upload one or more resume files"
+
+    if len(files) > MAX_BATCH_FILES:
+        return [], f"❌ Too many files (max {MAX_BATCH_FILES} per batch)"
+
+    if str(seniority_level).lower() not in VALID_SENIORITY:
+        return [], f"❌ Invalid seniority. Must be one of: {', '.join(SENIORITY_LEVELS)}"
+
+    if str(strictness_level).lower() not in VALID_STRICTNESS:
+        return [], f"❌ Invalid strictness. Must be one of: {', '.join(STRICTNESS_LEVELS)}"
+
+    file_paths = [f.name if hasattr(f, 'name') else str(f) for f in files]
+
+    progress(0.0, desc=f"Analyzing {len(file_paths)} resumes...")
+    results = await asyncio.gather(*[
+        get_analysis(path, seniority_level, strictness_level, deep_analysis, _no_progress)
+        for path in file_paths
+    ])
+
+    rows = []
+    for path, (analysis_results, outputs) in zip(file_paths, results):
+        name = os.path.basename(path)
+        if analysis_results is None:
+            rows.append([name, None, "", None, None, outputs[0]])
+        else:
+            rows.append([
+                name,
+                analysis_results['final_score'],
+                analysis_results['risk_assessment'].upper(),
+                analysis_results['total_claims'],
+                analysis_results.get('total_red_flags', 0),
+                analysis_results['recommendation']
+            ])
+
+    analyzed = sum(1 for analysis_results, _ in results if analysis_results is not None)
+    return rows, f"✅ Analyzed {analyzed} of {len(file_paths)} resumes"
+
+def error_outputs(message: str) -> Tuple[str, Any, Any, Any, Any, str, str, str, str]:
+    """Gradio outputs for an analysis that stopped early with a message"""
+    return (message,) + _ERROR_OUTPUT_PADDING
+
+def _no_progress(*args, **kwargs):
+    """Progress callback for batch runs, which report once for the whole batch"""
+
+def finish_analysis(cache_key: str, pending: asyncio.Future):
+    """
+    Record a finished pipeline run in the result cache
+
+    Runs as a done callback on the pipeline task rather than in the handler,
+    so a run whose client disconnected (cancelling the handler but not the
+    shielded task) is still cached and served instantly on re-upload. Runs
+    where a stage fell back after a Gemini failure are not cached, so the
+    next upload retries Gemini.
+    """
+    _pending_analyses.pop(cache_key, None)
+
+    if pending.cancelled() or pending.exception() is not None:
+        return
+
+    analysis_results, outputs = pending.result()
+    if analysis_results is not None and not analysis_results.get('_degraded'):
+        RESULT_CACHE[cache_key] = (analysis_results, outputs)
+        if DISK_RESULT_CACHE is not None:
+            # Pickling the results stays off the event loop
+            asyncio.get_running_loop().run_in_executor(
+                None, store_disk_result, cache_key, (analysis_results, outputs)
+            )
+
+def load_disk_result(cache_key: str) -> Optional[Tuple]:
+    """Read an analysis from the disk result cache, or None on a miss or error"""
+    try:
+        return DISK_RESULT_CACHE.get(cache_key)
+    except Exception as e:
+        logger.warning("Disk result cache read failed: %s", e)
+        return None
+
+def store_disk_result(cache_key: str, value: Tuple) -> None:
+    """Write an analysis to the disk result cache for RESULT_CACHE_TTL seconds"""
+    try:
+        DISK_RESULT_CACHE.set(cache_key, value, expire=RESULT_CACHE_TTL)
+    except Exception as e:
+        logger.warning("Disk result cache write failed: %s", e)
+
+def hash_upload(file_path: str) -> str:
+    """
+    Hash an uploaded file through a read-only memory map
+
+    The kernel pages the file in as sha256 consumes it, so the upload is
+    never copied into Python memory.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+def get_analysis_cache_key(digest: str, seniority_level: str, strictness_level: str, deep_analysis: bool) -> str:
+    """Build the result cache key from the file hash and analysis settings"""
+    return f"{digest}|{seniority_level}|{strictness_level}|{deep_analysis}"
+
+async def run_analysis_pipeline(
+    file_path: str,
+    seniority_level: str,
+    strictness_level: str,
+    deep_analysis: bool,
+    progress,
+    publish: Optional[Callable[[Tuple], None]] = None
+) -> Tuple[Optional[Dict], Tuple[str, Any, Any, Any, Any, str, str, str, str]]:
+    """
+    Run the full analysis pipeline for one resume
+
+    Args:
+        publish: Optional callback receiving partial Gradio outputs once the
+            claim analysis is ready, before red flag detection runs
+
+    Returns:
+        Tuple of (analysis_results, Gradio outputs); analysis_results is None
+        when the run failed or produced nothing worth caching
+    """
+    cached_context = None
+
+    try:
+        progress(0.0, desc="Initializing analysis...")
+
+        # Reuse the session's modules for this strictness level
+        gemini_client = _session_ctx.get().gemini_client
+        pipeline = get_pipeline(strictness_level.lower())
+        # A stage that fell back to its rules-only result marks the run as
+        # degraded; runs sharing this client may also count, which at worst
+        # skips caching a good result
+        fallbacks_before = gemini_client.usage_stats['fallbacks']
+        cv_parser = pipeline['cv_parser']
+        claim_extractor = pipeline['claim_extractor']
+        evidence_validator = pipeline['evidence_validator']
+        red_flag_detector = pipeline['red_flag_detector']
 
         progress(0.1, desc="Parsing resume...")
-        parsed_cv = cv_parser.parse(file_path)
+        parsed_cv = await asyncio.to_thread(cv_parser.parse, file_path)
 
         progress(0.3, desc="Extracting claims...")
-        claims_result = claim_extractor.extract_claims(parsed_cv, seniority_level.lower())
+        claims_result = await claim_extractor.extract_claims_async(parsed_cv, seniority_level.lower())
         claims = claims_result['claims']
 
         if not claims:
@@ -690,18 +1313,42 @@ def analyze_resume(
             else:
                 error_msg = f"⚠️ No analyzable claims found. Sections detected: {', '.join(sections_found)}.\n\nEnsure resume includes specific achievements, not just responsibilities."
 
-            return error_msg, None, None, None, None, "", "", "", ""
+            return None, error_outputs(error_msg)
+
+        # Deep analysis sends the full resume with its larger prompts, so hold it
+        # in a Gemini context cache for the run (short resumes skip this and rely
+        # on implicit prefix caching instead). Created only once claims exist, so
+        # the no-claims exit above costs no cache round-trips
+        if deep_analysis:
+            cached_context = await asyncio.to_thread(
+                gemini_client.create_cached_context,
+                parsed_cv['raw_text'],
+                600,
+                os.path.basename(file_path)
+            )
 
         progress(0.5, desc="Validating evidence...")
-        validation_result = evidence_validator.validate_evidence(
+        validation_result = await evidence_validator.validate_evidence_async(
             claims,
             parsed_cv['raw_text'],
             check_links=deep_analysis,
-            deep_repo_analysis=deep_analysis
+            deep_repo_analysis=deep_analysis,
+            cached_content=cached_context
         )
 
+        # The claim breakdown only needs validations, so show it while the
+        # red flag stage runs
+        claim_analysis = generate_enhanced_claim_analysis(claims, validation_result['validations'])
+        if publish:
+            publish((
+                "⏳ Evidence validated. Detecting red flags and scoring...",
+                None, None, None, None, "", "",
+                claim_analysis,
+                "⏳ Claim analysis ready, detecting red flags..."
+            ))
+
         progress(0.7, desc="Detecting red flags...")
-        red_flag_result = red_flag_detector.detect_red_flags(
+        red_flag_result = await red_flag_detector.detect_red_flags_async(
             {
                 'claims': claims,
                 'validations': validation_result['validations'],
@@ -713,83 +1360,62 @@ def analyze_resume(
         progress(0.8, desc="Generating comprehensive analysis...")
 
         # Fix consistency score normalization (handle both 0-1 and 0-100 formats)
-        def normalize_score(score):
-            """Normalize score to 0-100 range"""
-            if score > 100:
-                # Score was mistakenly multiplied
-                return min(100, score / 100)
-            elif score <= 1:
-                # Score is in decimal format (0-1)
-                return score * 100
-            else:
-                # Score is already in 0-100 range
-                return min(100, score)
-
-        consistency_score = normalize_score(validation_result['consistency_score'])
+        # and clamp it here, so every display and export reads it as stored
+        consistency_score = max(0, min(100, normalize_score(validation_result['consistency_score'])))
 
         # Round all scores to 1 decimal place for consistency
         final_score = round(red_flag_result['final_score'], 1)
         credibility_score = round(red_flag_result['credibility_score'], 1)
         consistency_score = round(consistency_score, 1)
 
+        # Tally verification statuses, evidence types and links once for all displays
+        summary = summarize_claims(claims, validation_result['validations'])
+        status_counts = summary['status_counts']
+
+        # One timestamp for the analysis, reused by the report generators
+        analyzed_at = datetime.now()
+
         # Compile comprehensive results
         analysis_results = {
             'parsed_cv': parsed_cv,
             'claims': claims,
             'total_claims': len(claims),
-            'verified_claims': sum(1 for v in validation_result['validations'] if v.get('verification_status') == 'verified'),
-            'unverified_claims': sum(1 for v in validation_result['validations'] if v.get('verification_status') in ['unverified', 'red_flag']),
+            'verified_claims': status_counts['verified'],
+            'unverified_claims': status_counts['unverified'] + status_counts['red_flag'],
             'claim_metrics': claims_result['metrics'],
             'validations': validation_result['validations'],
+            '_evidence_counts': summary['evidence_counts'],
+            '_version': time.monotonic_ns(),
             'consistency_score': consistency_score,
             'red_flags': red_flag_result['red_flags'],
+            '_flag_index': build_flag_index(red_flag_result['red_flags']),
             'total_red_flags': len(red_flag_result['red_flags']),
             'credibility_score': credibility_score,
             'final_score': final_score,
             'risk_assessment': red_flag_result['risk_assessment'],
             'recommendation': red_flag_result['summary']['recommendation'],
             'seniority_level': seniority_level,
-            'links_checked': sum(1 for c in claims if c.get('links_artifacts')),
+            'links_checked': summary['links_checked'],
             'structure_quality': 'Well-organized',
-            'analysis_timestamp': datetime.now().isoformat()
+            'analysis_timestamp': analyzed_at.isoformat(),
+            '_analyzed_at': analyzed_at,
+            '_degraded': gemini_client.usage_stats['fallbacks'] > fallbacks_before
         }
 
-        # Store for export
-        current_session['last_analysis'] = analysis_results
-
-        # Generate visualizations
-        progress(0.9, desc="Creating visualizations...")
-        try:
-            heatmap = EvidenceHeatmap()
-            heatmap_fig = heatmap.create_evidence_heatmap(validation_result['validations'], claims)
-            dashboard_fig = heatmap.create_credibility_dashboard(
-                {
-                    'final': red_flag_result['final_score'],
-                    'credibility': red_flag_result['credibility_score'],
-                    'consistency': consistency_score,
-                    'risk_level': red_flag_result['risk_assessment']
-                },
-                red_flag_result['red_flags']
-            )
-            distribution_fig = heatmap.create_claim_distribution(claims)
-            validation_fig = heatmap.create_validation_summary(validation_result['validations'], claims)
-        except Exception as e:
-            logger.warning(f"Visualization failed: {e}")
-            heatmap_fig = dashboard_fig = distribution_fig = validation_fig = None
-
-        # Generate comprehensive displays
+        # Generate comprehensive displays (the figures are built when the
+        # Visual Analytics tab is opened, see show_visualizations)
+        progress(0.9, desc="Preparing analysis display...")
         main_analysis = generate_comprehensive_analysis_display(analysis_results)
-        claim_analysis = generate_enhanced_claim_analysis(claims, validation_result['validations'])
         interview_guide = generate_interview_guide_with_context(analysis_results)
 
         progress(1.0, desc="Analysis complete!")
 
-        return (
+        return analysis_results, (
             main_analysis,
-            dashboard_fig,
-            heatmap_fig,
-            distribution_fig,
-            validation_fig,
+            None,
+            None,
+            None,
+            None,
             interview_guide,
             "",  # Red flags are now integrated into main analysis
             claim_analysis,
@@ -797,191 +1423,328 @@ def analyze_resume(
         )
 
     except Exception as e:
-        logger.error(f"Analysis failed: {traceback.format_exc()}")
-        return f"❌ Analysis failed: {str(e)}", None, None, None, None, "", "", "", ""
+        logger.exception("Analysis failed: %s", e)
+        return None, error_outputs(f"❌ Analysis failed: {str(e)}")
+
+    finally:
+        if cached_context:
+            await asyncio.to_thread(gemini_client.delete_cached_context, cached_context)
+
+def build_plot_data(build, *args) -> PlotData:
+    """
+    Build a plotly figure and serialize it for gr.Plot
+
+    gr.Plot passes PlotData through untouched, so the figure's to_json()
+    runs here on a worker thread instead of in Gradio's postprocessing on
+    the event loop, and cached payloads are never re-serialized.
+    """
+    return PlotData(type='plotly', plot=build(*args).to_json(engine=PLOT_JSON_ENGINE))
+
+@functools.cache
+def get_heatmap():
+    """Shared EvidenceHeatmap; it only holds its theme and colour schemes"""
+    from evidence_heatmap import EvidenceHeatmap
+    return EvidenceHeatmap()
+
+def generate_visualizations(results: Dict) -> Tuple[Any, Any, Any, Any]:
+    """
+    Build the Visual Analytics figures for an analysis
+
+    The four figures are independent, so they are built and serialized on a
+    small thread pool; a figure that fails to build is returned as None on
+    its own.
+
+    Returns:
+        Tuple of (dashboard, heatmap, distribution, validation) plot payloads
+    """
+    try:
+        heatmap = get_heatmap()
+        claims = results['claims']
+        validations = results['validations']
+
+        builds = (
+            (heatmap.create_credibility_dashboard, (
+                {
+                    'final': results['final_score'],
+                    'credibility': results['credibility_score'],
+                    'consistency': results['consistency_score'],
+                    'risk_level': results['risk_assessment']
+                },
+                results['red_flags']
+            )),
+            (heatmap.create_evidence_heatmap, (validations, claims)),
+            (heatmap.create_claim_distribution, (claims,)),
+            (heatmap.create_validation_summary, (validations, claims)),
+        )
+    except Exception as e:
+        logger.warning("Visualization failed: %s", e)
+        return None, None, None, None
+
+    with ThreadPoolExecutor(max_workers=len(builds)) as executor:
+        futures = [executor.submit(build_plot_data, build, *args) for build, args in builds]
+
+    figures = []
+    for future in futures:
+        try:
+            figures.append(future.result())
+        except Exception as e:
+            logger.warning("Visualization failed: %s", e)
+            figures.append(None)
 
-def export_report(format_type: str):
-    """Export report with fixed consistency score"""
-    global current_session
+    return tuple(figures)
 
-    if 'last_analysis' not in current_session:
+def show_visualizations(session: Session) -> Tuple[Any, Any, Any, Any]:
+    """
+    Gradio handler for selecting the Visual Analytics tab
+
+    Plotting is kept off the analysis path; the figures are built the first
+    time an analysis is viewed and reused through RENDER_CACHE after that.
+    Re-selecting the tab for the same analysis sends no plot payloads, since
+    the plots already hold those figures.
+    """
+    if session.last_analysis is None:
+        return None, None, None, None
+
+    version = session.last_analysis.get('_version')
+    if version is not None and version == session.visuals_shown:
+        return gr.update(), gr.update(), gr.update(), gr.update()
+
+    figures = render_once(session.last_analysis, generate_visualizations)
+    session.visuals_shown = version
+    return figures
+
+def export_report(format_type: str, session: Session):
+    """Export the last analysis in the chosen format"""
+    if session.last_analysis is None:
         return None, "❌ No analysis available to export. Please analyze a resume first."
 
     try:
-        results = current_session['last_analysis']
+        results = session.last_analysis
 
-        # Fix consistency score before export
-        results['consistency_score'] = min(100, results.get('consistency_score', 0))
+        # Repeat clicks for the same analysis and format serve the file already
+        # written, unless the stale-export sweep has removed it since
+        export_key = (results.get('_version'), format_type)
+        exported = session.export_paths.get(export_key)
+        if exported is not None and os.path.exists(exported[0]):
+            return exported
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        exported = write_export(results, format_type)
+        if exported[0] is not None and export_key[0] is not None:
+            session.export_paths[export_key] = exported
+        return exported
 
-        if format_type == "HTML":
-            html_content = generate_comprehensive_html_report(results)
+    except Exception as e:
+        logger.exception("Export failed: %s", e)
+        return None, f"❌ Export failed: {str(e)}"
 
-            temp_file = tempfile.NamedTemporaryFile(
-                mode='w',
-                delete=False,
-                suffix='.html',
-                prefix=f'resume_analysis_{timestamp}_'
-            )
-            temp_file.write(html_content)
-            temp_file.close()
+def write_export(results: Dict, format_type: str) -> Tuple[Optional[str], str]:
+    """
+    Write one export file for an analysis
 
-            return temp_file.name, "✅ HTML report generated successfully!"
+    Args:
+        results: Analysis results to export
+        format_type: One of HTML, JSON, CSV or Interview Checklist
 
-        elif format_type == "JSON":
-            json_content = json.dumps(results, indent=2, default=str)
+    Returns:
+        Tuple of (file path, status message)
+    """
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    sweep_stale_exports()
 
-            temp_file = tempfile.NamedTemporaryFile(
-                mode='w',
-                delete=False,
-                suffix='.json',
-                prefix=f'resume_analysis_{timestamp}_'
-            )
-            temp_file.write(json_content)
-            temp_file.close()
+    if format_type == "HTML":
+        html_content = render_once(results, generate_comprehensive_html_report)
 
-            return temp_file.name, "✅ JSON export generated successfully!"
+        with export_file(f'resume_analysis_{timestamp}_', '.html') as temp_file:
+            temp_file.write(html_content)
 
-        elif format_type == "CSV":
-            claims_df = pd.DataFrame(results.get('claims', []))
+        return temp_file.name, "✅ HTML report generated successfully!"
 
-            if not claims_df.empty:
-                columns = ['claim_text', 'category', 'verifiability_level', 'evidence_present']
-                columns = [col for col in columns if col in claims_df.columns]
-                claims_df = claims_df[columns]
+    elif format_type == "JSON":
+        # Leave out derived render indexes such as _flag_index
+        export_data = {k: v for k, v in results.items() if not str(k).startswith('_')}
 
-            temp_file = tempfile.NamedTemporaryFile(
-                mode='w',
-                delete=False,
-                suffix='.csv',
-                prefix=f'resume_claims_{timestamp}_'
-            )
-            claims_df.to_csv(temp_file.name, index=False)
-            temp_file.close()
+        with export_file(f'resume_analysis_{timestamp}_', '.json', mode='wb' if HAS_ORJSON else 'w') as temp_file:
+            if HAS_ORJSON:
+                temp_file.write(orjson.dumps(
+                    export_data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            else:
+                # json.dump encodes chunk by chunk straight into the file
+                json.dump(export_data, temp_file, indent=2, default=str)
 
-            return temp_file.name, "✅ CSV export generated successfully!"
+        return temp_file.name, "✅ JSON export generated successfully!"
 
-        elif format_type == "Interview Checklist":
-            checklist = generate_professional_interview_checklist(results)
+    elif format_type == "CSV":
+        claims = results.get('claims', [])
+        # One pass over the claims collects every field present in any of them
+        present = set().union(*claims)
+        columns = [col for col in CSV_EXPORT_COLUMNS if col in present]
 
-            temp_file = tempfile.NamedTemporaryFile(
-                mode='w',
-                delete=False,
-                suffix='.txt',
-                prefix=f'interview_checklist_{timestamp}_'
-            )
+        with export_file(f'resume_claims_{timestamp}_', '.csv', newline='') as temp_file:
+            writer = csv.DictWriter(temp_file, fieldnames=columns, restval='', extrasaction='ignore')
+            if columns:
+                writer.writeheader()
+            writer.writerows(claims)
+
+        return temp_file.name, "✅ CSV export generated successfully!"
+
+    elif format_type == "Interview Checklist":
+        checklist = render_once(results, generate_professional_interview_checklist)
+
+        with export_file(f'interview_checklist_{timestamp}_', '.txt') as temp_file:
             temp_file.write(checklist)
-            temp_file.close()
 
-            return temp_file.name, "✅ Interview checklist generated successfully!"
+        return temp_file.name, "✅ Interview checklist generated successfully!"
 
-    except Exception as e:
-        logger.error(f"Export failed: {traceback.format_exc()}")
-        return None, f"❌ Export failed: {str(e)}"
+    return None, f"❌ Unknown export format: {format_type}"
 
-def generate_comprehensive_html_report(results: Dict) -> str:
-    """Generate beautiful comprehensive HTML report"""
+def render_once(results: Dict, renderer) -> Any:
+    """
+    Render an export document (or figure set) once per analysis
 
-    # Fix consistency score
-    consistency_score = min(100, results.get('consistency_score', 0))
+    Repeat exports of the same analysis reuse the rendered output, keyed on
+    the analysis '_version' stamped by the pipeline.
+    """
+    version = results.get('_version')
+    if version is None:
+        return renderer(results)
+
+    key = (version, renderer.__name__)
+    with _render_cache_lock:
+        rendered = RENDER_CACHE.get(key)
+    if rendered is None:
+        # Render outside the lock; two threads racing on a new analysis may
+        # both render it, and the later write wins
+        rendered = renderer(results)
+        with _render_cache_lock:
+            RENDER_CACHE[key] = rendered
+    return rendered
+
+@contextlib.contextmanager
+def export_file(prefix: str, suffix: str, mode: str = 'w', newline: Optional[str] = None):
+    """
+    Create an export file in EXPORT_DIR that outlives the handler
 
-    html = f"""
+    The file is kept on success so Gradio can serve it, but closed and
+    removed if writing fails, so partial exports never accumulate.
+    """
+    temp_file = tempfile.NamedTemporaryFile(
+        mode=mode,
+        buffering=EXPORT_WRITE_BUFFER,
+        encoding=None if 'b' in mode else 'utf-8',
+        delete=False,
+        newline=newline,
+        suffix=suffix,
+        prefix=prefix,
+        dir=EXPORT_DIR
+    )
+    try:
+        yield temp_file
+    except BaseException:
+        temp_file.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_file.name)
+        raise
+    else:
+        temp_file.close()
+
+def sweep_stale_exports(max_age: float = EXPORT_MAX_AGE):
+    """Remove exports older than max_age seconds from EXPORT_DIR"""
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(EXPORT_DIR))
+    except FileNotFoundError:
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+atexit.register(sweep_stale_exports)
+
+def analysis_time(results: Dict) -> datetime:
+    """When the analysis ran, falling back to now for results without a timestamp"""
+    return results.get('_analyzed_at') or datetime.now()
+
+# Stylesheet of the HTML export, structural rules only so it renders the same
+# in browsers, mail clients and PDF converters; whitespace is collapsed once
+_HTML_REPORT_CSS = re.sub(r'\s*([{};])\s*', r'\1', re.sub(r'\s+', ' ', """
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background: #f5f5f5;
+}
+.container { max-width: 1200px; margin: 0 auto; padding: 20px; }
+.header {
+    background: #667eea;
+    color: white;
+    padding: 40px;
+    border-radius: 10px;
+    margin-bottom: 30px;
+}
+.score-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 20px;
+    margin: 30px 0;
+}
+.score-card { background: white; padding: 25px; border-radius: 10px; text-align: center; }
+.score-number { font-size: 48px; font-weight: bold; color: #667eea; }
+.section { background: white; padding: 30px; margin: 20px 0; border-radius: 10px; }
+h2 {
+    color: #2c3e50;
+    border-bottom: 3px solid #667eea;
+    padding-bottom: 10px;
+    margin-bottom: 20px;
+}
+.footer { text-align: center; padding: 20px; color: #666; margin-top: 40px; }
+""")).strip()
+
+# Standalone HTML export, filled with string.Template.substitute
+_HTML_REPORT_TEMPLATE = string.Template("""
 <!DOCTYPE html>
 <html>
 <head>
     <title>Resume Verification Report - Professional Analysis</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-        }}
-        .score-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }}
-        .score-card {{
-            background: white;
-            padding: 25px;
-            border-radius: 10px;
-            text-align: center;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        }}
-        .score-number {{
-            font-size: 48px;
-            font-weight: bold;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }}
-        .section {{
-            background: white;
-            padding: 30px;
-            margin: 20px 0;
-            border-radius: 10px;
-            box-shadow: 0 3px 10px rgba(0,0,0,0.05);
-        }}
-        h2 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-        }}
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            color: #666;
-            margin-top: 40px;
-        }}
-    </style>
+    <style>$css</style>
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>📊 Resume Verification Report</h1>
             <p style="margin-top: 10px;">
-                <strong>Generated:</strong> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}<br>
-                <strong>Seniority Level:</strong> {results.get('seniority_level', 'Unknown')}<br>
+                <strong>Generated:</strong> $generated<br>
+                <strong>Seniority Level:</strong> $seniority_level<br>
                 <strong>Analysis Type:</strong> Comprehensive Multi-Factor Verification
             </p>
         </div>
 
         <div class="score-grid">
             <div class="score-card">
-                <div class="score-number">{results.get('final_score', 0):.0f}</div>
+                <div class="score-number">$final_score</div>
                 <h3>Final Score</h3>
                 <p>Overall Assessment</p>
             </div>
             <div class="score-card">
-                <div class="score-number">{results.get('credibility_score', 0):.0f}</div>
+                <div class="score-number">$credibility_score</div>
                 <h3>Credibility</h3>
                 <p>Evidence Strength</p>
             </div>
             <div class="score-card">
-                <div class="score-number">{consistency_score:.0f}</div>
+                <div class="score-number">$consistency_score</div>
                 <h3>Consistency</h3>
                 <p>Internal Coherence</p>
             </div>
             <div class="score-card">
-                <div class="score-number" style="font-size: 32px;">{results.get('risk_assessment', 'UNKNOWN').upper()}</div>
+                <div class="score-number" style="font-size: 32px;">$risk_level</div>
                 <h3>Risk Level</h3>
                 <p>Hiring Risk</p>
             </div>
@@ -989,12 +1752,12 @@ def generate_comprehensive_html_report(results: Dict) -> str:
 
         <div class="section">
             <h2>Executive Summary</h2>
-            <p><strong>Recommendation:</strong> {results.get('recommendation', 'No recommendation available')}</p>
+            <p><strong>Recommendation:</strong> $recommendation</p>
             <p style="margin-top: 10px;">
-                Based on analysis of <strong>{results.get('total_claims', 0)} claims</strong>,
-                we found <strong>{results.get('verified_claims', 0)} verified</strong>,
-                <strong>{results.get('unverified_claims', 0)} unverified</strong>, and
-                <strong>{results.get('total_red_flags', 0)} red flags</strong>.
+                Based on analysis of <strong>$total_claims claims</strong>,
+                we found <strong>$verified_claims verified</strong>,
+                <strong>$unverified_claims unverified</strong>, and
+                <strong>$total_red_flags red flags</strong>.
             </p>
         </div>
 
@@ -1005,21 +1768,35 @@ def generate_comprehensive_html_report(results: Dict) -> str:
     </div>
 </body>
 </html>
-"""
-    return html
+""")
+
+def generate_comprehensive_html_report(results: Dict) -> str:
+    """Generate beautiful comprehensive HTML report"""
+
+    return _HTML_REPORT_TEMPLATE.substitute(
+        css=_HTML_REPORT_CSS,
+        generated=analysis_time(results).strftime('%B %d, %Y at %I:%M %p'),
+        seniority_level=results.get('seniority_level', 'Unknown'),
+        final_score=f"{results.get('final_score', 0):.0f}",
+        credibility_score=f"{results.get('credibility_score', 0):.0f}",
+        consistency_score=f"{results.get('consistency_score', 0):.0f}",
+        risk_level=results.get('risk_assessment', 'UNKNOWN').upper(),
+        recommendation=results.get('recommendation', 'No recommendation available'),
+        total_claims=results.get('total_claims', 0),
+        verified_claims=results.get('verified_claims', 0),
+        unverified_claims=results.get('unverified_claims', 0),
+        total_red_flags=results.get('total_red_flags', 0)
+    )
 
 def generate_professional_interview_checklist(results: Dict) -> str:
     """Generate professional interview checklist"""
 
-    # Fix consistency score
-    consistency_score = min(100, results.get('consistency_score', 0))
-
-    checklist = f"""
+    parts = [f"""
 ================================================================================
                     PROFESSIONAL INTERVIEW VERIFICATION CHECKLIST
 ================================================================================
 
-Date: {datetime.now().strftime('%B %d, %Y')}
+Date: {analysis_time(results).strftime('%B %d, %Y')}
 Position Level: {results.get('seniority_level', 'Unknown')}
 
 CANDIDATE RISK ASSESSMENT
@@ -1027,7 +1804,7 @@ CANDIDATE RISK ASSESSMENT
 Overall Risk Level: {results.get('risk_assessment', 'Unknown').upper()}
 Final Score: {results.get('final_score', 0):.0f}/100
 Credibility Score: {results.get('credibility_score', 0):.0f}/100
-Consistency Score: {consistency_score:.0f}/100
+Consistency Score: {results.get('consistency_score', 0):.0f}/100
 Red Flags Detected: {results.get('total_red_flags', 0)}
 
 KEY METRICS
@@ -1039,10 +1816,10 @@ Buzzword Density: {results.get('claim_metrics', {}).get('buzzword_density', 0)*1
 
 PRIORITY VERIFICATION POINTS
 ================================================================================
-"""
+"""]
 
     for i, flag in enumerate(results.get('red_flags', [])[:10], 1):
-        checklist += f"""
+        parts.append(f"""
 {i}. [{flag.get('severity', '').upper()}] {flag.get('description', '')}
 
    Primary Question: {flag.get('interview_probe', 'Verify this claim')}
@@ -1055,9 +1832,9 @@ PRIORITY VERIFICATION POINTS
    Notes: ________________________________________________________
    _____________________________________________________________
 
-"""
+""")
 
-    checklist += """
+    parts.append("""
 FINAL RECOMMENDATION
 ================================================================================
 
@@ -1069,36 +1846,17 @@ FINAL RECOMMENDATION
 Interviewer: ______________________  Date: _____________________________
 
 ================================================================================
-"""
+""")
 
-    return checklist
+    return "".join(parts)
 
 # Create enhanced Gradio interface
 def create_interface():
     """Create professional Gradio interface with comprehensive features"""
 
-    custom_css = """
-    .gradio-container {
-        font-family: 'Segoe UI', Arial, sans-serif !important;
-    }
-    .main-title {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 30px;
-        border-radius: 10px;
-        text-align: center;
-        margin-bottom: 20px;
-    }
-    """
-
-    with gr.Blocks(title="Resume Verification System - Professional", theme=gr.themes.Soft(), css=custom_css) as app:
+    with gr.Blocks(title="Resume Verification System - Professional", theme=gr.themes.Soft(), css=_CUSTOM_CSS) as app:
 
-        gr.HTML("""
-        <div class="main-title">
-            <h1>🔍 Resume Verification System - Professional Edition</h1>
-            <p>Comprehensive AI-powered analysis with full transparency and interpretability</p>
-        </div>
-        """)
+        gr.HTML(_TITLE_HTML)
 
         # Tab 1: Setup
         with gr.Tab("1️⃣ Setup & Configuration"):
@@ -1161,14 +1919,14 @@ def create_interface():
 
                     seniority_dropdown = gr.Dropdown(
                         label="Seniority Level",
-                        choices=["Intern", "Junior", "Mid", "Senior", "Lead"],
+                        choices=list(SENIORITY_LEVELS),
                         value="Mid",
                         info="Adjusts verification thresholds"
                     )
 
                     strictness_radio = gr.Radio(
                         label="Analysis Strictness",
-                        choices=["Low", "Medium", "High"],
+                        choices=list(STRICTNESS_LEVELS),
                         value="Medium",
                         info="Controls sensitivity of red flag detection"
                     )
@@ -1185,8 +1943,23 @@ def create_interface():
                     analysis_status = gr.Textbox(label="Status", interactive=False)
                     comprehensive_analysis = gr.Markdown(label="Comprehensive Analysis")
 
+            with gr.Accordion("📚 Batch Analysis", open=False):
+                gr.Markdown("Screen several resumes at once with the settings above.")
+                batch_files = gr.File(
+                    label="Upload Resumes",
+                    file_types=[".pdf", ".docx", ".txt"],
+                    file_count="multiple"
+                )
+                batch_button = gr.Button("🚀 Analyze Batch", variant="secondary")
+                batch_status = gr.Textbox(label="Batch Status", interactive=False)
+                batch_results = gr.Dataframe(
+                    headers=BATCH_SUMMARY_COLUMNS,
+                    label="Batch Summary",
+                    interactive=False
+                )
+
         # Tab 3: Visualizations
-        with gr.Tab("3️⃣ Visual Analytics"):
+        with gr.Tab("3️⃣ Visual Analytics") as visuals_tab:
             with gr.Row():
                 dashboard_plot = gr.Plot(label="Credibility Dashboard")
             with gr.Row():
@@ -1254,16 +2027,19 @@ def create_interface():
         # Hidden components for unused outputs
         red_flags_hidden = gr.Markdown(visible=False)
 
+        # Per-user session (Gemini client, pipelines, last analysis)
+        session_state = gr.State(Session())
+
         # Event handlers
         init_button.click(
-            fn=lambda key, mock: initialize_session(key, mock),
-            inputs=[api_key_input, mock_mode],
-            outputs=[init_status]
+            fn=start_session,
+            inputs=[api_key_input, mock_mode, session_state],
+            outputs=[init_status, session_state]
         )
 
         analyze_button.click(
             fn=analyze_resume,
-            inputs=[file_input, seniority_dropdown, strictness_radio, deep_analysis],
+            inputs=[file_input, seniority_dropdown, strictness_radio, deep_analysis, session_state],
             outputs=[
                 comprehensive_analysis,
                 dashboard_plot,
@@ -1277,9 +2053,22 @@ def create_interface():
             ]
         )
 
+        visuals_tab.select(
+            fn=show_visualizations,
+            inputs=[session_state],
+            outputs=[dashboard_plot, heatmap_plot, distribution_plot, validation_plot]
+        )
+
+        batch_button.click(
+            fn=analyze_resumes_batch,
+            inputs=[batch_files, seniority_dropdown, strictness_radio, deep_analysis, session_state],
+            outputs=[batch_results, batch_status],
+            concurrency_limit=BATCH_CONCURRENCY
+        )
+
         download_button.click(
             fn=export_report,
-            inputs=[report_format],
+            inputs=[report_format, session_state],
             outputs=[download_file, export_status]
         )
 
@@ -1289,9 +2078,14 @@ def create_interface():
 if __name__ == "__main__":
     logger.info("Starting Resume Verification System...")
     app = create_interface()
+    app.queue(default_concurrency_limit=QUEUE_CONCURRENCY, max_size=QUEUE_MAX_SIZE)
     app.launch(
         server_name="0.0.0.0",
         server_port=7860,
         share=False,
-        show_error=True
+        show_error=True,
+        max_file_size=MAX_UPLOAD_SIZE,
+        # Compress JSON payloads and downloaded reports; Starlette leaves the
+        # queue's text/event-stream responses uncompressed
+        app_kwargs={'middleware': [Middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE)]}
     )
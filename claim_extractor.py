@@ -7,6 +7,7 @@ Implements seniority-aware extraction and buzzword detection
 import json
 import re
 import hashlib
+import asyncio
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
@@ -74,6 +75,20 @@ class ClaimExtractor:
         'intern': ['intern', 'trainee', 'apprentice', 'co-op']
     }
     
+    # Low temperature for precise extraction
+    EXTRACTION_CONFIG = {
+        'temperature': 0.1,
+        'top_p': 0.95,
+        'max_output_tokens': 4096
+    }
+    
+    # Buzzwords counted towards claim density, scanned in a single pass
+    BUZZWORDS = ('innovative', 'cutting-edge', 'revolutionary', 'transformative',
+                 'disruptive', 'passionate', 'driven', 'thought-leader')
+    BUZZWORD_PATTERN = re.compile(
+        '(?=(?:%s))' % '|'.join(map(re.escape, BUZZWORDS))
+    )
+    
     def __init__(self, gemini_client: Any, enable_caching: bool = True):
         """
         Initialize claim extractor
@@ -99,52 +114,147 @@ class ClaimExtractor:
         Returns:
             Structured claims with metadata and scoring
         """
-        all_claims = []
-        extraction_metadata = {
+        extraction_metadata = self._new_extraction_metadata()
+        
+        # Auto-detect seniority if not provided
+        if not seniority_level:
+            seniority_level = self._detect_seniority_level(parsed_cv['raw_text'])
+            
+        section_results = []
+        
+        for section_name, section_text in self._sections_to_process(parsed_cv):
+            section_claims = self._get_cached_section(section_text, seniority_level, extraction_metadata)
+            
+            if section_claims is None:
+                # Extract claims using Gemini
+                section_claims = self._extract_section_claims(
+                    section_text, 
+                    section_name,
+                    seniority_level
+                )
+                self._cache_section(section_text, seniority_level, section_claims)
+                
+            section_results.append((section_name, section_claims))
+            
+        return self._compile_extraction(section_results, parsed_cv, seniority_level, extraction_metadata)
+        
+    async def extract_claims_async(self,
+                                   parsed_cv: Dict[str, Any],
+                                   seniority_level: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async variant of extract_claims
+        
+        Sections are independent, so all uncached sections are sent to
+        Gemini concurrently instead of one round-trip after another.
+        
+        Args:
+            parsed_cv: Parsed CV data from CVParser
+            seniority_level: Override detected seniority level
+            
+        Returns:
+            Structured claims with metadata and scoring
+        """
+        extraction_metadata = self._new_extraction_metadata()
+        
+        if not seniority_level:
+            seniority_level = self._detect_seniority_level(parsed_cv['raw_text'])
+            
+        sections = self._sections_to_process(parsed_cv)
+        cached = [
+            self._get_cached_section(section_text, seniority_level, extraction_metadata)
+            for _, section_text in sections
+        ]
+        
+        pending = [
+            (i, section_name, section_text)
+            for i, (section_name, section_text) in enumerate(sections)
+            if cached[i] is None
+        ]
+        
+        extracted = await asyncio.gather(*[
+            self._extract_section_claims_async(section_text, section_name, seniority_level)
+            for _, section_name, section_text in pending
+        ])
+        
+        for (i, _, section_text), section_claims in zip(pending, extracted):
+            self._cache_section(section_text, seniority_level, section_claims)
+            cached[i] = section_claims
+            
+        section_results = [
+            (section_name, section_claims)
+            for (section_name, _), section_claims in zip(sections, cached)
+        ]
+        
+        return self._compile_extraction(section_results, parsed_cv, seniority_level, extraction_metadata)
+        
+    def _new_extraction_metadata(self) -> Dict[str, Any]:
+        """
+        Create the metadata record filled in during extraction
+        """
+        return {
             'start_time': datetime.now().isoformat(),
             'sections_processed': [],
             'total_tokens_used': 0,
             'cache_hits': 0
         }
         
-        # Auto-detect seniority if not provided
-        if not seniority_level:
-            seniority_level = self._detect_seniority_level(parsed_cv['raw_text'])
-            
-        # Process each section
+    def _sections_to_process(self, parsed_cv: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        Return (section_name, section_text) pairs worth sending for extraction
+        """
         sections_to_process = ['work_experience', 'projects', 'skills', 'research']
         
-        for section_name in sections_to_process:
-            if section_name in parsed_cv['sections']:
-                section_text = parsed_cv['sections'][section_name]
-                
-                if not section_text.strip():
-                    continue
-                    
-                # Check cache
-                cache_key = self._generate_cache_key(section_text, seniority_level)
+        return [
+            (section_name, parsed_cv['sections'][section_name])
+            for section_name in sections_to_process
+            if section_name in parsed_cv['sections']
+            and parsed_cv['sections'][section_name].strip()
+        ]
+        
+    def _get_cached_section(self,
+                            section_text: str,
+                            seniority_level: str,
+                            extraction_metadata: Dict[str, Any]) -> Optional[List[Dict]]:
+        """
+        Return cached claims for a section, or None on a miss
+        """
+        if not self.enable_caching:
+            return None
+            
+        cache_key = self._generate_cache_key(section_text, seniority_level)
+        
+        if cache_key in self.claim_cache:
+            extraction_metadata['cache_hits'] += 1
+            return self.claim_cache[cache_key]
+            
+        return None
+        
+    def _cache_section(self, section_text: str, seniority_level: str, section_claims: List[Dict]) -> None:
+        """
+        Remember extracted claims for a section
+        """
+        if self.enable_caching:
+            cache_key = self._generate_cache_key(section_text, seniority_level)
+            self.claim_cache[cache_key] = section_claims
+            
+    def _compile_extraction(self,
+                            section_results: List[Tuple[str, List[Dict]]],
+                            parsed_cv: Dict[str, Any],
+                            seniority_level: str,
+                            extraction_metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge per-section claims, post-process them and compute metrics
+        """
+        all_claims = []
+        
+        for section_name, section_claims in section_results:
+            # Add section source to each claim
+            for claim in section_claims:
+                claim['section_source'] = section_name
+                claim['extraction_timestamp'] = datetime.now().isoformat()
                 
-                if self.enable_caching and cache_key in self.claim_cache:
-                    section_claims = self.claim_cache[cache_key]
-                    extraction_metadata['cache_hits'] += 1
-                else:
-                    # Extract claims using Gemini
-                    section_claims = self._extract_section_claims(
-                        section_text, 
-                        section_name,
-                        seniority_level
-                    )
-                    
-                    if self.enable_caching:
-                        self.claim_cache[cache_key] = section_claims
-                        
-                # Add section source to each claim
-                for claim in section_claims:
-                    claim['section_source'] = section_name
-                    claim['extraction_timestamp'] = datetime.now().isoformat()
-                    
-                all_claims.extend(section_claims)
-                extraction_metadata['sections_processed'].append(section_name)
+            all_claims.extend(section_claims)
+            extraction_metadata['sections_processed'].append(section_name)
                 
         # Post-process claims
         all_claims = self._post_process_claims(all_claims, parsed_cv)
@@ -218,49 +328,77 @@ class ClaimExtractor:
         """
         Extract claims from a specific CV section using Gemini
         """
-        # Prepare prompt
-        prompt = CLAIM_EXTRACTION_PROMPT.format(
-            section_type=section_type,
-            section_text=section_text,
-            seniority_level=seniority_level
-        )
+        prompt = self._build_extraction_prompt(section_text, section_type, seniority_level)
         
         try:
             # Call Gemini API with low temperature for precision
             response = self.gemini_client.generate_content(
                 prompt,
-                generation_config={
-                    'temperature': 0.1,
-                    'top_p': 0.95,
-                    'max_output_tokens': 4096
-                }
+                generation_config=self.EXTRACTION_CONFIG
             )
+            return self._parse_section_claims(response)
             
-            # Parse JSON response
-            result = json.loads(response.text)
-            claims_data = result.get('claims', [])
+        except Exception as e:
+            logger.error("Gemini extraction failed for %s: %s", section_type, e)
+            self.gemini_client.record_fallback()
+            # Fallback to rule-based extraction
+            return self._fallback_extraction(section_text, section_type)
             
-            # Convert to Claim objects and validate
-            claims = []
-            for claim_dict in claims_data:
-                # Add unique ID if not present
-                if 'claim_id' not in claim_dict:
-                    claim_dict['claim_id'] = self._generate_claim_id(claim_dict['claim_text'])
-                    
-                # Add confidence score based on evidence and specificity
-                claim_dict['confidence_score'] = self._calculate_confidence_score(claim_dict)
-                
-                # Validate and clean claim
-                if self._validate_claim(claim_dict):
-                    claims.append(claim_dict)
-                    
-            return claims
+    async def _extract_section_claims_async(self,
+                                            section_text: str,
+                                            section_type: str,
+                                            seniority_level: str) -> List[Dict]:
+        """
+        Async variant of _extract_section_claims
+        """
+        prompt = self._build_extraction_prompt(section_text, section_type, seniority_level)
+        
+        try:
+            response = await self.gemini_client.generate_content_async(
+                prompt,
+                generation_config=self.EXTRACTION_CONFIG
+            )
+            return self._parse_section_claims(response)
             
         except Exception as e:
-            logger.error(f"Gemini extraction failed for {section_type}: {e}")
-            # Fallback to rule-based extraction
+            logger.error("Gemini extraction failed for %s: %s", section_type, e)
+            self.gemini_client.record_fallback()
             return self._fallback_extraction(section_text, section_type)
             
+    def _build_extraction_prompt(self, section_text: str, section_type: str, seniority_level: str) -> str:
+        """
+        Fill the claim extraction prompt for a section
+        """
+        return CLAIM_EXTRACTION_PROMPT.format(
+            section_type=section_type,
+            section_text=section_text,
+            seniority_level=seniority_level
+        )
+        
+    def _parse_section_claims(self, response: Any) -> List[Dict]:
+        """
+        Turn a Gemini extraction response into validated claim dicts
+        """
+        # Parse JSON response
+        result = json.loads(response.text)
+        claims_data = result.get('claims', [])
+        
+        # Convert to Claim objects and validate
+        claims = []
+        for claim_dict in claims_data:
+            # Add unique ID if not present
+            if 'claim_id' not in claim_dict:
+                claim_dict['claim_id'] = self._generate_claim_id(claim_dict['claim_text'])
+                
+            # Add confidence score based on evidence and specificity
+            claim_dict['confidence_score'] = self._calculate_confidence_score(claim_dict)
+            
+            # Validate and clean claim
+            if self._validate_claim(claim_dict):
+                claims.append(claim_dict)
+                
+        return claims
+            
     def _fallback_extraction(self, text: str, section_type: str) -> List[Dict]:
         """
         Rule-based fallback extraction if LLM fails
@@ -558,16 +696,11 @@ class ClaimExtractor:
             evidence_counts[ev] = evidence_counts.get(ev, 0) + 1
             
         # Calculate buzzword density
-        buzzwords = ['innovative', 'cutting-edge', 'revolutionary', 'transformative',
-                    'disruptive', 'passionate', 'driven', 'thought-leader']
-        
         total_words = sum(len(claim['claim_text'].split()) for claim in claims)
-        buzzword_count = 0
-        
-        for claim in claims:
-            text_lower = claim['claim_text'].lower()
-            for buzzword in buzzwords:
-                buzzword_count += text_lower.count(buzzword)
+        buzzword_count = sum(
+            len(self.BUZZWORD_PATTERN.findall(claim['claim_text'].lower()))
+            for claim in claims
+        )
                 
         # Calculate specificity (has metrics, technologies, or links)
         specific_claims = sum(
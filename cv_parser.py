@@ -4,11 +4,14 @@ Extracts and structures text from PDF, DOCX, and TXT files
 Includes metadata extraction and section identification
 """
 
+import io
+import os
 import re
+import mmap
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, BinaryIO
 import logging
 
 # Optional imports with graceful fallbacks
@@ -84,13 +87,39 @@ class CVParser:
         if extension not in self.supported_formats:
             raise ValueError(f"Unsupported format: {extension}")
             
+        with open(file_path, 'rb') as stream:
+            return self.parse_stream(stream, extension, path.name)
+        
+    def parse_stream(self, stream: BinaryIO, suffix: str, name: str = '') -> Dict[str, Any]:
+        """
+        Parse CV from an open binary file
+        
+        Files are never copied whole into Python memory: the PDF and DOCX
+        backends read from the stream directly, and plain text is decoded
+        straight from a memory map.
+        
+        Args:
+            stream: Open binary file positioned anywhere
+            suffix: File extension including the dot (e.g. '.pdf')
+            name: Original file name, recorded in file_info
+            
+        Returns:
+            Parsed CV data with sections and metadata
+        """
+        extension = suffix.lower()
+        
+        if extension not in self.supported_formats:
+            raise ValueError(f"Unsupported format: {extension}")
+            
+        size = stream.seek(0, io.SEEK_END)
+        
         # Extract raw text based on format
         if extension == '.pdf':
-            text, metadata = self._parse_pdf(file_path)
+            text, metadata = self._parse_pdf(stream)
         elif extension == '.docx':
-            text, metadata = self._parse_docx(file_path)
+            text, metadata = self._parse_docx(stream)
         else:  # .txt
-            text, metadata = self._parse_txt(file_path)
+            text, metadata = self._parse_txt(stream)
             
         # Structure text into sections
         sections = self._identify_sections(text)
@@ -108,14 +137,14 @@ class CVParser:
             'timeline': timeline,
             'statistics': stats,
             'file_info': {
-                'name': path.name,
-                'size': path.stat().st_size,
+                'name': name,
+                'size': size,
                 'format': extension,
                 'parsed_at': datetime.now().isoformat()
             }
         }
         
-    def _parse_pdf(self, file_path: str) -> Tuple[str, Dict]:
+    def _parse_pdf(self, stream: BinaryIO) -> Tuple[str, Dict]:
         """
         Extract text and metadata from PDF
         
@@ -128,48 +157,49 @@ class CVParser:
         # Try PyPDF2 first
         if HAS_PYPDF2:
             try:
-                with open(file_path, 'rb') as file:
-                    pdf = PyPDF2.PdfReader(file)
-                    
-                    # Extract metadata
-                    if self.extract_metadata and pdf.metadata:
-                        metadata = {
-                            'author': pdf.metadata.get('/Author', ''),
-                            'creation_date': str(pdf.metadata.get('/CreationDate', '')),
-                            'modification_date': str(pdf.metadata.get('/ModDate', '')),
-                            'producer': pdf.metadata.get('/Producer', ''),
-                            'title': pdf.metadata.get('/Title', ''),
-                            'subject': pdf.metadata.get('/Subject', ''),
-                        }
-                    
-                    # Extract text from all pages
-                    for page_num, page in enumerate(pdf.pages):
-                        try:
-                            page_text = page.extract_text()
-                            if page_text:
-                                text_pypdf.append(page_text)
-                        except Exception as e:
-                            logger.warning(f"PyPDF2 failed on page {page_num}: {e}")
+                stream.seek(0)
+                pdf = PyPDF2.PdfReader(stream)
+                
+                # Extract metadata
+                if self.extract_metadata and pdf.metadata:
+                    metadata = {
+                        'author': pdf.metadata.get('/Author', ''),
+                        'creation_date': str(pdf.metadata.get('/CreationDate', '')),
+                        'modification_date': str(pdf.metadata.get('/ModDate', '')),
+                        'producer': pdf.metadata.get('/Producer', ''),
+                        'title': pdf.metadata.get('/Title', ''),
+                        'subject': pdf.metadata.get('/Subject', ''),
+                    }
+                
+                # Extract text from all pages
+                for page_num, page in enumerate(pdf.pages):
+                    try:
+                        page_text = page.extract_text()
+                        if page_text:
+                            text_pypdf.append(page_text)
+                    except Exception as e:
+                        logger.warning("PyPDF2 failed on page %s: %s", page_num, e)
                             
             except Exception as e:
-                logger.error(f"PyPDF2 extraction failed: {e}")
+                logger.error("PyPDF2 extraction failed: %s", e)
         else:
             logger.warning("PyPDF2 not available")
             
         # Try pdfplumber for better layout preservation
         if HAS_PDFPLUMBER:
             try:
-                with pdfplumber.open(file_path) as pdf:
+                stream.seek(0)
+                with pdfplumber.open(stream) as pdf:
                     for page in pdf.pages:
                         try:
                             page_text = page.extract_text()
                             if page_text:
                                 text_plumber.append(page_text)
                         except Exception as e:
-                            logger.warning(f"pdfplumber failed on page: {e}")
+                            logger.warning("pdfplumber failed on page: %s", e)
                             
             except Exception as e:
-                logger.error(f"pdfplumber extraction failed: {e}")
+                logger.error("pdfplumber extraction failed: %s", e)
         else:
             logger.warning("pdfplumber not available")
             
@@ -179,29 +209,28 @@ class CVParser:
         if not text:
             # Fallback: try to read as text
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    text = f.read()
-                    logger.warning("Used fallback text extraction for PDF")
+                text = self._decode_text(stream)
+                logger.warning("Used fallback text extraction for PDF")
             except:
                 raise ValueError("Could not extract text from PDF - install PyPDF2 or pdfplumber")
             
         return text, metadata
         
-    def _parse_docx(self, file_path: str) -> Tuple[str, Dict]:
+    def _parse_docx(self, stream: BinaryIO) -> Tuple[str, Dict]:
         """
         Extract text and metadata from DOCX
         """
         if not HAS_DOCX:
             # Fallback: try to read as text
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    text = f.read()
-                    logger.warning("python-docx not available, used fallback text extraction")
-                    return text, {}
+                text = self._decode_text(stream)
+                logger.warning("python-docx not available, used fallback text extraction")
+                return text, {}
             except:
                 raise ValueError("Could not extract text from DOCX - install python-docx")
         
-        doc = Document(file_path)
+        stream.seek(0)
+        doc = Document(stream)
         text = []
         metadata = {}
         
@@ -235,20 +264,35 @@ class CVParser:
                     
         return '\n'.join(text), metadata
         
-    def _parse_txt(self, file_path: str) -> Tuple[str, Dict]:
+    def _parse_txt(self, stream: BinaryIO) -> Tuple[str, Dict]:
         """
         Extract text from TXT file
         """
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-            text = file.read()
+        text = self._decode_text(stream)
             
         metadata = {
             'encoding': 'utf-8',
-            'file_size': Path(file_path).stat().st_size
+            'file_size': stream.seek(0, io.SEEK_END)
         }
         
         return text, metadata
         
+    @staticmethod
+    def _decode_text(stream: BinaryIO) -> str:
+        """
+        Decode a stream as UTF-8 text with universal newlines
+        
+        Decodes from a read-only memory map of the file, so no intermediate
+        bytes copy of the contents is made.
+        """
+        if os.fstat(stream.fileno()).st_size == 0:
+            text = ''
+        else:
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, 'utf-8', 'ignore')
+                
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+        
     def _identify_sections(self, text: str) -> Dict[str, str]:
         """
         Identify and extract CV sections using regex patterns
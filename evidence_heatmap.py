@@ -6,7 +6,6 @@ Creates interactive heatmaps showing evidence strength across CV sections
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional
 import logging
@@ -301,4 +300,4 @@ class EvidenceHeatmap:
         with open(output_path, 'w') as f:
             f.write(html_string)
         
-        logger.info(f"Exported to {output_path}")
\ No newline at end of file
+        logger.info("Exported to %s", output_path)
\ No newline at end of file
@@ -12,6 +12,7 @@ import json
 import requests
 import hashlib
 from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 import logging
@@ -39,9 +40,9 @@ except ImportError:
 
 # Handle both modular and flat imports
 try:
-    from config.prompts import EVIDENCE_VALIDATION_PROMPT, SCORING_CONFIG
+    from config.prompts import EVIDENCE_VALIDATION_PROMPT, EVIDENCE_VALIDATION_TASK_PROMPT, SCORING_CONFIG
 except ImportError:
-    from prompts import EVIDENCE_VALIDATION_PROMPT, SCORING_CONFIG
+    from prompts import EVIDENCE_VALIDATION_PROMPT, EVIDENCE_VALIDATION_TASK_PROMPT, SCORING_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +86,26 @@ class EvidenceValidator:
         }
     }
     
+    # Max simultaneous connections for async link checks
+    LINK_CHECK_CONNECTIONS = 32
+    
+    VALIDATION_CONFIG = {
+        'temperature': 0.2,
+        'top_p': 0.95,
+        'max_output_tokens': 8192,
+        'response_mime_type': 'application/json'
+    }
+    
+    # Claims per validation prompt, sized from the answer rather than the
+    # prompt: each validation comes back as up to about
+    # VALIDATION_OUTPUT_TOKENS of JSON, and the whole batch's answer (plus
+    # the consistency score) must fit in max_output_tokens or it is cut off
+    # and the batch falls back to empty validations. Each batch resends the
+    # CV text unless it is held in a context cache (deep analysis of longer
+    # resumes only)
+    VALIDATION_OUTPUT_TOKENS = 400
+    VALIDATION_BATCH_SIZE = (VALIDATION_CONFIG['max_output_tokens'] - 512) // VALIDATION_OUTPUT_TOKENS
+    
     def __init__(self, 
                  gemini_client: Any,
                  enable_async: bool = True,
@@ -103,6 +124,13 @@ class EvidenceValidator:
         self.session = None
         self.executor = ThreadPoolExecutor(max_workers=max_concurrent_checks)
         
+        # Pooled keep-alive connections for link and repository checks, so
+        # repeat hosts (github.com, api.github.com) skip DNS and TLS setup
+        self.http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        
     async def __aenter__(self):
         """Async context manager entry"""
         if self.enable_async:
@@ -118,7 +146,8 @@ class EvidenceValidator:
                          claims: List[Dict],
                          full_cv_text: str,
                          check_links: bool = True,
-                         deep_repo_analysis: bool = True) -> Dict[str, Any]:
+                         deep_repo_analysis: bool = True,
+                         cached_content: Optional[str] = None) -> Dict[str, Any]:
         """
         Validate evidence for all claims
         
@@ -127,38 +156,146 @@ class EvidenceValidator:
             full_cv_text: Complete CV text for cross-reference
             check_links: Perform HTTP status checks on URLs
             deep_repo_analysis: Perform repository forensics
+            cached_content: Gemini context cache already holding full_cv_text
             
         Returns:
             Validation results with scores and findings
         """
         validation_start = datetime.now()
         
-        # Prepare claims for validation
-        claims_json = json.dumps(claims, default=str)
-        
         # Get LLM-based validation
-        llm_validations = self._get_llm_validation(claims_json, full_cv_text)
+        llm_validations = self._get_llm_validation(claims, full_cv_text, cached_content)
+        
+        # Add link integrity checks and repository forensics
+        artifact_checks = [
+            self._check_artifacts(claim, check_links, deep_repo_analysis)
+            for claim in claims
+        ]
+        
+        return self._compile_validations(
+            claims, llm_validations, artifact_checks, full_cv_text, validation_start
+        )
+        
+    async def validate_evidence_async(self,
+                                      claims: List[Dict],
+                                      full_cv_text: str,
+                                      check_links: bool = True,
+                                      deep_repo_analysis: bool = True,
+                                      cached_content: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async variant of validate_evidence
+        
+        The Gemini validation batches and the per-claim link/repository
+        checks do not depend on each other, so they all run concurrently.
+        
+        Args:
+            claims: List of extracted claims
+            full_cv_text: Complete CV text for cross-reference
+            check_links: Perform HTTP status checks on URLs
+            deep_repo_analysis: Perform repository forensics
+            cached_content: Gemini context cache already holding full_cv_text
+            
+        Returns:
+            Validation results with scores and findings
+        """
+        validation_start = datetime.now()
+        
+        # One connection-limited aiohttp session serves every link check
+        link_session = None
+        if check_links and HAS_AIOHTTP:
+            link_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.LINK_CHECK_CONNECTIONS),
+                timeout=aiohttp.ClientTimeout(sock_connect=5, sock_read=5)
+            )
+            
+        try:
+            llm_validations, *artifact_checks = await asyncio.gather(
+                self._get_llm_validation_async(claims, full_cv_text, cached_content),
+                *[
+                    self._check_artifacts_async(claim, check_links, deep_repo_analysis, link_session)
+                    for claim in claims
+                ]
+            )
+        finally:
+            if link_session:
+                await link_session.close()
         
-        # Enhance with technical validations
+        return self._compile_validations(
+            claims, llm_validations, artifact_checks, full_cv_text, validation_start
+        )
+        
+    def _check_artifacts(self,
+                         claim: Dict,
+                         check_links: bool,
+                         deep_repo_analysis: bool) -> Dict[str, Any]:
+        """
+        Run the HTTP-bound link and repository checks for one claim
+        """
+        checks = {}
+        
+        # Add link integrity checks
+        if check_links and claim.get('links_artifacts'):
+            checks['link_integrity'] = self._validate_links(claim['links_artifacts'])
+            
+        # Add repository forensics
+        if deep_repo_analysis:
+            repo_links = [url for url in claim.get('links_artifacts', []) 
+                        if any(host in url for host in ['github.com', 'gitlab.com'])]
+                        
+            if repo_links:
+                checks['repository_forensics'] = self._analyze_repositories(repo_links, claim)
+                
+        return checks
+        
+    async def _check_artifacts_async(self,
+                                     claim: Dict,
+                                     check_links: bool,
+                                     deep_repo_analysis: bool,
+                                     link_session: Any = None) -> Dict[str, Any]:
+        """
+        Async variant of _check_artifacts
+        
+        Link checks run on the shared aiohttp session when one is given;
+        repository forensics (and link checks without aiohttp) run in a thread.
+        """
+        if link_session is None:
+            return await asyncio.to_thread(self._check_artifacts, claim, check_links, deep_repo_analysis)
+            
+        checks = {}
+        repo_task = None
+        
+        if deep_repo_analysis:
+            repo_links = [url for url in claim.get('links_artifacts', []) 
+                        if any(host in url for host in ['github.com', 'gitlab.com'])]
+                        
+            if repo_links:
+                repo_task = asyncio.create_task(
+                    asyncio.to_thread(self._analyze_repositories, repo_links, claim)
+                )
+                
+        if check_links and claim.get('links_artifacts'):
+            checks['link_integrity'] = await self._validate_links_async(claim['links_artifacts'], link_session)
+            
+        if repo_task:
+            checks['repository_forensics'] = await repo_task
+            
+        return checks
+        
+    def _compile_validations(self,
+                             claims: List[Dict],
+                             llm_validations: List[Dict],
+                             artifact_checks: List[Dict],
+                             full_cv_text: str,
+                             validation_start: datetime) -> Dict[str, Any]:
+        """
+        Combine LLM and technical validations into scored results
+        """
         validations = []
         
         for i, claim in enumerate(claims):
             # Start with LLM validation if available
             base_validation = llm_validations[i] if i < len(llm_validations) else {}
-            
-            # Add link integrity checks
-            if check_links and claim.get('links_artifacts'):
-                link_results = self._validate_links(claim['links_artifacts'])
-                base_validation['link_integrity'] = link_results
-                
-            # Add repository forensics
-            if deep_repo_analysis:
-                repo_links = [url for url in claim.get('links_artifacts', []) 
-                            if any(host in url for host in ['github.com', 'gitlab.com'])]
-                            
-                if repo_links:
-                    repo_analysis = self._analyze_repositories(repo_links, claim)
-                    base_validation['repository_forensics'] = repo_analysis
+            base_validation.update(artifact_checks[i])
                     
             # Cross-section triangulation
             triangulation = self._cross_validate_claim(claim, claims, full_cv_text)
@@ -184,37 +321,167 @@ class EvidenceValidator:
             'summary': self._generate_validation_summary(validations)
         }
         
-    def _get_llm_validation(self, claims_json: str, full_cv_text: str) -> List[Dict]:
+    def _get_llm_validation(self,
+                            claims: List[Dict],
+                            full_cv_text: str,
+                            cached_content: Optional[str] = None) -> List[Dict]:
         """
-        Get validation from Gemini LLM
+        Get validation from Gemini LLM, one prompt per batch of claims
+        
+        Returns:
+            One validation dict per claim, in claim order
         """
-        prompt = EVIDENCE_VALIDATION_PROMPT.format(
-            claims_json=claims_json,
-            full_cv_text=full_cv_text
-        )
+        validations = []
+        for batch in self._claim_batches(claims):
+            validations.extend(self._validate_batch(batch, full_cv_text, cached_content))
+        return validations
+            
+    async def _get_llm_validation_async(self,
+                                        claims: List[Dict],
+                                        full_cv_text: str,
+                                        cached_content: Optional[str] = None) -> List[Dict]:
+        """
+        Async variant of _get_llm_validation; the batches run concurrently
+        """
+        batches = await asyncio.gather(*[
+            self._validate_batch_async(batch, full_cv_text, cached_content)
+            for batch in self._claim_batches(claims)
+        ])
+        return [validation for batch in batches for validation in batch]
+        
+    def _validate_batch(self,
+                        claims: List[Dict],
+                        full_cv_text: str,
+                        cached_content: Optional[str] = None) -> List[Dict]:
+        """
+        Validate one batch of claims with a single Gemini prompt
+        """
+        prompt = self._build_validation_prompt(json.dumps(claims, default=str), full_cv_text, cached_content)
         
         try:
             response = self.gemini_client.generate_content(
                 prompt,
-                generation_config={
-                    'temperature': 0.2,
-                    'top_p': 0.95,
-                    'max_output_tokens': 4096
-                }
+                generation_config=self.VALIDATION_CONFIG,
+                cached_content=cached_content
             )
             
             result = json.loads(response.text)
-            return result.get('validations', [])
+            return self._align_validations(claims, result.get('validations', []))
             
         except Exception as e:
-            logger.error(f"LLM validation failed: {e}")
+            logger.error("LLM validation failed: %s", e)
+            self.gemini_client.record_fallback()
             # Return empty validations as fallback
-            return [{}] * len(json.loads(claims_json))
+            return [{} for _ in claims]
+            
+    async def _validate_batch_async(self,
+                                    claims: List[Dict],
+                                    full_cv_text: str,
+                                    cached_content: Optional[str] = None) -> List[Dict]:
+        """
+        Async variant of _validate_batch
+        """
+        prompt = self._build_validation_prompt(json.dumps(claims, default=str), full_cv_text, cached_content)
+        
+        try:
+            response = await self.gemini_client.generate_content_async(
+                prompt,
+                generation_config=self.VALIDATION_CONFIG,
+                cached_content=cached_content
+            )
+            
+            result = json.loads(response.text)
+            return self._align_validations(claims, result.get('validations', []))
+            
+        except Exception as e:
+            logger.error("LLM validation failed: %s", e)
+            self.gemini_client.record_fallback()
+            return [{} for _ in claims]
+            
+    def _claim_batches(self, claims: List[Dict]) -> List[List[Dict]]:
+        """
+        Split claims into batches of VALIDATION_BATCH_SIZE
+        """
+        batch_size = self.VALIDATION_BATCH_SIZE
+        return [claims[i:i + batch_size] for i in range(0, len(claims), batch_size)]
+        
+    def _align_validations(self, claims: List[Dict], validations: List[Dict]) -> List[Dict]:
+        """
+        Map the model's validations back onto the batch's claims
+        
+        Validations are matched by claim_id, falling back to position when
+        the model did not echo an id.
+        """
+        by_id = {v.get('claim_id'): v for v in validations if isinstance(v, dict)}
+        
+        aligned = []
+        for i, claim in enumerate(claims):
+            validation = by_id.get(claim.get('claim_id'))
+            if validation is None and i < len(validations) and isinstance(validations[i], dict):
+                validation = validations[i]
+            aligned.append(dict(validation or {}))
+            
+        return aligned
+            
+    def _build_validation_prompt(self,
+                                 claims_json: str,
+                                 full_cv_text: str,
+                                 cached_content: Optional[str] = None) -> str:
+        """
+        Fill the evidence validation prompt
+        
+        The CV text is left out when it is already in the context cache.
+        """
+        if cached_content:
+            return EVIDENCE_VALIDATION_TASK_PROMPT.format(claims_json=claims_json)
+            
+        return EVIDENCE_VALIDATION_PROMPT.format(
+            claims_json=claims_json,
+            full_cv_text=full_cv_text
+        )
             
     def _validate_links(self, urls: List[str]) -> Dict[str, Any]:
         """
         Check link integrity and gather metadata
         """
+        statuses = [self._fetch_link_status(url) for url in urls]
+        return self._compile_link_results(urls, statuses)
+        
+    async def _validate_links_async(self, urls: List[str], session: Any) -> Dict[str, Any]:
+        """
+        Check link integrity with concurrent HEAD requests on a shared aiohttp session
+        """
+        statuses = await asyncio.gather(
+            *[self._fetch_link_status_async(url, session) for url in urls]
+        )
+        return self._compile_link_results(urls, statuses)
+        
+    def _fetch_link_status(self, url: str) -> Tuple[int, str]:
+        """
+        Return (status_code, last_modified) for a URL, status 0 if unreachable
+        """
+        try:
+            response = self.http.head(url, timeout=5, allow_redirects=True)
+            return response.status_code, response.headers.get('Last-Modified', 'unknown')
+        except requests.RequestException:
+            return 0, 'unknown'
+            
+    async def _fetch_link_status_async(self, url: str, session: Any) -> Tuple[int, str]:
+        """
+        Async variant of _fetch_link_status
+        """
+        try:
+            async with session.head(url, allow_redirects=True) as response:
+                return response.status, response.headers.get('Last-Modified', 'unknown')
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return 0, 'unknown'
+            
+    def _compile_link_results(self,
+                              urls: List[str],
+                              statuses: List[Tuple[int, str]]) -> Dict[str, Any]:
+        """
+        Classify checked links by artifact tier and compute the weighted score
+        """
         results = {
             'total_links': len(urls),
             'valid_links': 0,
@@ -222,7 +489,7 @@ class EvidenceValidator:
             'link_details': []
         }
         
-        for url in urls:
+        for url, (status_code, last_modified) in zip(urls, statuses):
             try:
                 # Parse URL
                 parsed = urlparse(url)
@@ -238,19 +505,7 @@ class EvidenceValidator:
                         weight = tier_config['weight']
                         break
                         
-                # Check HTTP status (with timeout)
-                try:
-                    response = requests.head(url, timeout=5, allow_redirects=True)
-                    status_code = response.status_code
-                    is_valid = status_code < 400
-                    
-                    # Try to get last modified
-                    last_modified = response.headers.get('Last-Modified', 'unknown')
-                    
-                except requests.RequestException:
-                    status_code = 0
-                    is_valid = False
-                    last_modified = 'unknown'
+                is_valid = 0 < status_code < 400
                     
                 if is_valid:
                     results['valid_links'] += 1
@@ -268,7 +523,7 @@ class EvidenceValidator:
                 })
                 
             except Exception as e:
-                logger.warning(f"Link validation failed for {url}: {e}")
+                logger.warning("Link validation failed for %s: %s", url, e)
                 results['broken_links'] += 1
                 
         # Calculate weighted link score
@@ -300,14 +555,14 @@ class EvidenceValidator:
                     
                     # Get repo info via API
                     api_url = f"https://api.github.com/repos/{owner}/{repo_name}"
-                    response = requests.get(api_url, timeout=10)
+                    response = self.http.get(api_url, timeout=10)
                     
                     if response.status_code == 200:
                         repo_data = response.json()
                         
                         # Get commit statistics
                         commits_url = f"{api_url}/commits"
-                        commits_response = requests.get(commits_url, timeout=10)
+                        commits_response = self.http.get(commits_url, timeout=10)
                         commits = commits_response.json() if commits_response.status_code == 200 else []
                         
                         # Analyze repository characteristics
@@ -343,7 +598,7 @@ class EvidenceValidator:
                         repo_analysis['findings'].append(analysis)
                         
             except Exception as e:
-                logger.warning(f"Repository analysis failed for {url}: {e}")
+                logger.warning("Repository analysis failed for %s: %s", url, e)
                 repo_analysis['findings'].append({
                     'url': url,
                     'error': str(e),
@@ -616,12 +871,8 @@ class EvidenceValidator:
                 'red_flags': 0
             }
             
-        status_counts = {
-            'verified': sum(1 for v in validations if v.get('verification_status') == 'verified'),
-            'partial': sum(1 for v in validations if v.get('verification_status') == 'partial'),
-            'unverified': sum(1 for v in validations if v.get('verification_status') == 'unverified'),
-            'red_flag': sum(1 for v in validations if v.get('verification_status') == 'red_flag')
-        }
+        # One pass over the statuses instead of a scan per status
+        status_counts = Counter(v.get('verification_status') for v in validations)
         
         return {
             'total_validated': total,
@@ -5,6 +5,7 @@ Handles API interactions with rate limiting, retries, and caching
 
 import time
 import json
+import asyncio
 import hashlib
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -33,6 +34,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+class _GenaiUnavailableResponse:
+    """Fallback response when google-generativeai is not installed"""
+    text = json.dumps({"status": "mock", "message": "google-generativeai not installed"})
+
 class GeminiClient:
     """
     Wrapper for Google Gemini API with enhanced features:
@@ -49,6 +54,19 @@ class GeminiClient:
         'requests_per_day': 1500
     }
     
+    # Max Gemini requests in flight at once from the async API
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Explicit context caches below this size are rejected by the API
+    MIN_CACHED_CONTEXT_TOKENS = 4096
+    
+    DEFAULT_GENERATION_CONFIG = {
+        'temperature': 0.2,
+        'top_p': 0.95,
+        'top_k': 40,
+        'max_output_tokens': 4096,
+    }
+    
     def __init__(self, 
                  api_key: str,
                  model_name: str = 'gemini-2.0-flash-exp',
@@ -71,20 +89,24 @@ class GeminiClient:
             
         genai.configure(api_key=api_key)
         
+        self.safety_settings = {
+            HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+            HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+            HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+            HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+        }
+        
         self.model = genai.GenerativeModel(
             model_name=model_name,
-            safety_settings={
-                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-            }
+            safety_settings=self.safety_settings
         )
         
         self.model_name = model_name
+        self.context_models = {}
         self.enable_caching = enable_caching
         self.cache_ttl = cache_ttl
         self.response_cache = {} if enable_caching else None
+        self.request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
         
         # Usage tracking
         self.usage_stats = {
@@ -92,13 +114,15 @@ class GeminiClient:
             'total_tokens': 0,
             'cache_hits': 0,
             'errors': 0,
+            'fallbacks': 0,
             'start_time': datetime.now()
         }
         
     def generate_content(self,
                         prompt: str,
                         generation_config: Optional[Dict] = None,
-                        use_cache: bool = True) -> Any:
+                        use_cache: bool = True,
+                        cached_content: Optional[str] = None) -> Any:
         """
         Generate content with rate limiting and retries
         
@@ -106,64 +130,188 @@ class GeminiClient:
             prompt: Input prompt for the model
             generation_config: Generation parameters
             use_cache: Whether to use cached response if available
+            cached_content: Name of an explicit context cache to prepend
             
         Returns:
             Model response
         """
-        # Check cache
-        if self.enable_caching and use_cache:
-            cache_key = self._get_cache_key(prompt, generation_config)
-            cached_response = self._get_cached_response(cache_key)
-            
-            if cached_response:
-                self.usage_stats['cache_hits'] += 1
-                logger.debug(f"Cache hit for prompt hash: {cache_key[:8]}")
-                return cached_response
+        cached_response = self._lookup_cache(prompt, generation_config, use_cache, cached_content)
+        if cached_response:
+            return cached_response
                 
         # Default generation config
         if generation_config is None:
-            generation_config = {
-                'temperature': 0.2,
-                'top_p': 0.95,
-                'top_k': 40,
-                'max_output_tokens': 4096,
-            }
+            generation_config = dict(self.DEFAULT_GENERATION_CONFIG)
             
         try:
             # Make API call
-            logger.debug(f"Calling Gemini API with {len(prompt)} character prompt")
+            logger.debug("Calling Gemini API with %s character prompt", len(prompt))
             
             if HAS_GENAI:
-                response = self.model.generate_content(
+                response = self._get_model(cached_content).generate_content(
                     prompt,
                     generation_config=genai.GenerationConfig(**generation_config)
                 )
             else:
                 # Fallback for when genai is not available
-                class MockResponse:
-                    def __init__(self):
-                        self.text = json.dumps({"status": "mock", "message": "google-generativeai not installed"})
-                response = MockResponse()
-            
-            # Update usage stats
-            self.usage_stats['total_requests'] += 1
-            
-            # Estimate tokens (rough approximation)
-            estimated_tokens = len(prompt) // 4 + len(response.text) // 4
-            self.usage_stats['total_tokens'] += estimated_tokens
-            
-            # Cache response
-            if self.enable_caching:
-                cache_key = self._get_cache_key(prompt, generation_config)
-                self._cache_response(cache_key, response)
-                
+                response = _GenaiUnavailableResponse()
+            
+            self._record_response(prompt, generation_config, response, cached_content)
             return response
             
         except Exception as e:
             self.usage_stats['errors'] += 1
-            logger.error(f"Gemini API error: {e}")
+            logger.error("Gemini API error: %s", e)
             raise
             
+    async def generate_content_async(self,
+                                     prompt: str,
+                                     generation_config: Optional[Dict] = None,
+                                     use_cache: bool = True,
+                                     cached_content: Optional[str] = None) -> Any:
+        """
+        Async variant of generate_content
+        
+        Lets callers overlap independent Gemini round-trips with
+        asyncio.gather instead of waiting on each one in turn.
+        
+        Args:
+            prompt: Input prompt for the model
+            generation_config: Generation parameters
+            use_cache: Whether to use cached response if available
+            cached_content: Name of an explicit context cache to prepend
+            
+        Returns:
+            Model response
+        """
+        cached_response = self._lookup_cache(prompt, generation_config, use_cache, cached_content)
+        if cached_response:
+            return cached_response
+            
+        if generation_config is None:
+            generation_config = dict(self.DEFAULT_GENERATION_CONFIG)
+            
+        try:
+            logger.debug("Calling Gemini API (async) with %s character prompt", len(prompt))
+            
+            if HAS_GENAI:
+                # Bound fan-out from gathered stages to stay within rate limits
+                async with self.request_semaphore:
+                    response = await self._get_model(cached_content).generate_content_async(
+                        prompt,
+                        generation_config=genai.GenerationConfig(**generation_config)
+                    )
+            else:
+                # Same fallback as generate_content
+                response = _GenaiUnavailableResponse()
+            
+            self._record_response(prompt, generation_config, response, cached_content)
+            return response
+            
+        except Exception as e:
+            self.usage_stats['errors'] += 1
+            logger.error("Gemini API error: %s", e)
+            raise
+            
+    def create_cached_context(self,
+                              text: str,
+                              ttl: int = 600,
+                              display_name: Optional[str] = None) -> Optional[str]:
+        """
+        Upload shared prompt context (e.g. the full resume) as an explicit cache
+        
+        Stages that reference the returned name are billed for the cached
+        tokens once instead of re-sending them with every prompt.
+        
+        Args:
+            text: Context to cache
+            ttl: Cache time-to-live in seconds
+            display_name: Human-readable cache label
+            
+        Returns:
+            Cache name, or None if the text is too short or caching failed
+        """
+        if len(text) // 4 < self.MIN_CACHED_CONTEXT_TOKENS:
+            return None
+            
+        try:
+            cache = genai.caching.CachedContent.create(
+                model=self.model_name,
+                display_name=display_name,
+                contents=[text],
+                ttl=timedelta(seconds=ttl)
+            )
+            logger.debug("Created context cache %s", cache.name)
+            return cache.name
+            
+        except Exception as e:
+            logger.warning("Context caching unavailable, sending full prompts: %s", e)
+            return None
+            
+    def delete_cached_context(self, name: str) -> None:
+        """
+        Delete an explicit context cache created by create_cached_context
+        """
+        self.context_models.pop(name, None)
+        
+        try:
+            genai.caching.CachedContent.get(name).delete()
+        except Exception as e:
+            logger.warning("Failed to delete context cache %s: %s", name, e)
+            
+    def _get_model(self, cached_content: Optional[str]) -> Any:
+        """
+        Return the model bound to an explicit context cache, or the default model
+        """
+        if not cached_content:
+            return self.model
+            
+        if cached_content not in self.context_models:
+            self.context_models[cached_content] = genai.GenerativeModel.from_cached_content(
+                cached_content=genai.caching.CachedContent.get(cached_content),
+                safety_settings=self.safety_settings
+            )
+            
+        return self.context_models[cached_content]
+        
+    def _lookup_cache(self,
+                      prompt: str,
+                      generation_config: Optional[Dict],
+                      use_cache: bool,
+                      cached_content: Optional[str] = None) -> Optional[Any]:
+        """
+        Return a cached response for the prompt if caching allows it
+        """
+        if not (self.enable_caching and use_cache):
+            return None
+            
+        cache_key = self._get_cache_key(prompt, generation_config, cached_content)
+        cached_response = self._get_cached_response(cache_key)
+        
+        if cached_response:
+            self.usage_stats['cache_hits'] += 1
+            logger.debug("Cache hit for prompt hash: %.8s", cache_key)
+            
+        return cached_response
+        
+    def _record_response(self,
+                         prompt: str,
+                         generation_config: Dict,
+                         response: Any,
+                         cached_content: Optional[str] = None) -> None:
+        """
+        Update usage stats and cache a fresh response
+        """
+        self.usage_stats['total_requests'] += 1
+        
+        # Estimate tokens (rough approximation)
+        estimated_tokens = len(prompt) // 4 + len(response.text) // 4
+        self.usage_stats['total_tokens'] += estimated_tokens
+        
+        if self.enable_caching:
+            cache_key = self._get_cache_key(prompt, generation_config, cached_content)
+            self._cache_response(cache_key, response)
+            
     def batch_generate(self,
                       prompts: List[str],
                       generation_config: Optional[Dict] = None,
@@ -191,7 +339,7 @@ class GeminiClient:
                     response = self.generate_content(prompt, generation_config)
                     batch_responses.append(response)
                 except Exception as e:
-                    logger.error(f"Failed to process prompt: {e}")
+                    logger.error("Failed to process prompt: %s", e)
                     batch_responses.append(None)
                     
                 # Small delay between requests
@@ -228,15 +376,18 @@ class GeminiClient:
             return json.loads(text.strip())
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Raw response: {text[:500]}")
+            logger.error("Failed to parse JSON response: %s", e)
+            logger.debug("Raw response: %.500s", text)
             return None
             
-    def _get_cache_key(self, prompt: str, config: Optional[Dict]) -> str:
+    def _get_cache_key(self,
+                       prompt: str,
+                       config: Optional[Dict],
+                       cached_content: Optional[str] = None) -> str:
         """
-        Generate cache key for prompt and config
+        Generate cache key for model, prompt, config and context cache
         """
-        key_data = f"{prompt}:{json.dumps(config, sort_keys=True) if config else ''}"
+        key_data = f"{self.model_name}:{cached_content or ''}:{prompt}:{json.dumps(config, sort_keys=True) if config else ''}"
         return hashlib.sha256(key_data.encode()).hexdigest()
         
     def _get_cached_response(self, cache_key: str) -> Optional[Any]:
@@ -297,6 +448,13 @@ class GeminiClient:
             )
         }
         
+    def record_fallback(self) -> None:
+        """
+        Count a stage that fell back to its rule-based result after a failed
+        or unparseable Gemini response
+        """
+        self.usage_stats['fallbacks'] += 1
+        
     def clear_cache(self) -> None:
         """
         Clear response cache
@@ -317,7 +475,7 @@ class GeminiClient:
             )
             return 'OK' in response.text
         except Exception as e:
-            logger.error(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
             return False
 
 class MockGeminiClient:
@@ -331,10 +489,14 @@ class MockGeminiClient:
             'total_tokens': 0,
             'cache_hits': 0,
             'errors': 0,
+            'fallbacks': 0,
             'start_time': datetime.now()
         }
         
-    def generate_content(self, prompt: str, generation_config: Optional[Dict] = None) -> Any:
+    def generate_content(self,
+                         prompt: str,
+                         generation_config: Optional[Dict] = None,
+                         cached_content: Optional[str] = None) -> Any:
         """
         Generate mock response
         """
@@ -383,6 +545,26 @@ class MockGeminiClient:
                 
         return MockResponse(response)
         
+    async def generate_content_async(self,
+                                     prompt: str,
+                                     generation_config: Optional[Dict] = None,
+                                     cached_content: Optional[str] = None) -> Any:
+        """
+        Async variant of generate_content
+        """
+        return self.generate_content(prompt, generation_config)
+        
+    def create_cached_context(self, text: str, ttl: int = 600, display_name: Optional[str] = None) -> Optional[str]:
+        """
+        Mock never creates context caches
+        """
+        return None
+        
+    def delete_cached_context(self, name: str) -> None:
+        """
+        No-op for mock
+        """
+        
     def validate_json_response(self, response: Any) -> Optional[Dict]:
         """
         Validate mock response
@@ -392,6 +574,12 @@ class MockGeminiClient:
         except:
             return None
             
+    def record_fallback(self) -> None:
+        """
+        Count a stage fallback
+        """
+        self.usage_stats['fallbacks'] += 1
+        
     def get_usage_stats(self) -> Dict[str, Any]:
         """
         Get mock usage stats
@@ -73,16 +73,21 @@ IMPORTANT:
 - Skip education verification completely
 """
 
-EVIDENCE_VALIDATION_PROMPT = """
+# The full CV leads the prompt so repeated requests share a cacheable prefix.
+# When the CV is already held in an explicit context cache, only
+# EVIDENCE_VALIDATION_TASK_PROMPT is sent.
+CV_CONTEXT_PROMPT = """
+Full CV text for cross-reference:
+{full_cv_text}
+"""
+
+EVIDENCE_VALIDATION_TASK_PROMPT = """
 You are validating evidence for CV claims.
 Temperature: 0.2 for balanced analysis
 
 Claims to validate:
 {claims_json}
 
-Full CV text for cross-reference:
-{full_cv_text}
-
 For EACH claim, assess:
 
 1. Direct Evidence:
@@ -136,6 +141,8 @@ Output JSON:
 }}
 """
 
+EVIDENCE_VALIDATION_PROMPT = CV_CONTEXT_PROMPT + EVIDENCE_VALIDATION_TASK_PROMPT
+
 RED_FLAG_DETECTION_PROMPT = """
 You are detecting credibility red flags in CV claims.
 Temperature: 0.2 for pattern detection
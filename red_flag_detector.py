@@ -11,6 +11,7 @@ Comprehensive red flag detection including:
 
 import re
 import json
+import asyncio
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from collections import Counter
@@ -70,6 +71,11 @@ class RedFlagDetector:
         'ninja', 'rockstar', 'unicorn', 'game-changer', 'paradigm',
         'bleeding-edge', 'next-generation', 'best-in-class'
     ]
+    # Single-pass scanner over all buzzwords; the lookahead keeps the count
+    # identical to summing str.count() per buzzword
+    BUZZWORD_PATTERN = re.compile(
+        '(?=(?:%s))' % '|'.join(map(re.escape, BUZZWORDS))
+    )
     
     # Technical claim patterns
     VAGUE_TECH_CLAIMS = [
@@ -81,6 +87,28 @@ class RedFlagDetector:
         r'helped with\s+\w+',
         r'exposure to\s+\w+'
     ]
+    VAGUE_TECH_PATTERN = re.compile('|'.join(VAGUE_TECH_CLAIMS))
+    
+    # Senior achievements (reporting lines, team size, budget)
+    SENIOR_CLAIM_PATTERN = re.compile(
+        r'report(?:ed|ing)?\s+to\s+(?:CEO|CTO|VP|President)'
+        r'|managed?\s+\d+\+?\s+(?:people|engineers|developers)'
+        r'|budget\s+of\s+\$?\d+M\+?',
+        re.IGNORECASE
+    )
+    
+    # Fields every emitted red flag carries; LLM flags missing one get the default
+    RED_FLAG_DEFAULTS = {
+        'severity': 'medium',
+        'category': '',
+        'description': ''
+    }
+    
+    DETECTION_CONFIG = {
+        'temperature': 0.2,
+        'top_p': 0.95,
+        'max_output_tokens': 4096
+    }
     
     def __init__(self, 
                  gemini_client: Any,
@@ -123,6 +151,48 @@ class RedFlagDetector:
         # Perform rule-based detection
         rule_flags = self._detect_rule_based_flags(validated_claims, seniority_level)
         
+        return self._compile_red_flags(
+            llm_flags, rule_flags, validated_claims, seniority_level, detection_start
+        )
+        
+    async def detect_red_flags_async(self,
+                                     validated_claims: Dict,
+                                     seniority_level: str,
+                                     role_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async variant of detect_red_flags
+        
+        The rule-based pass runs in a worker thread while the Gemini
+        request is in flight.
+        
+        Args:
+            validated_claims: Claims with validation results
+            seniority_level: Detected or specified seniority
+            role_type: Type of role (engineering, research, etc.)
+            
+        Returns:
+            Red flags with severity and interview questions
+        """
+        detection_start = datetime.now()
+        
+        llm_flags, rule_flags = await asyncio.gather(
+            self._get_llm_red_flags_async(validated_claims, seniority_level, role_type),
+            asyncio.to_thread(self._detect_rule_based_flags, validated_claims, seniority_level)
+        )
+        
+        return self._compile_red_flags(
+            llm_flags, rule_flags, validated_claims, seniority_level, detection_start
+        )
+        
+    def _compile_red_flags(self,
+                           llm_flags: List[Dict],
+                           rule_flags: List[Dict],
+                           validated_claims: Dict,
+                           seniority_level: str,
+                           detection_start: datetime) -> Dict[str, Any]:
+        """
+        Merge LLM and rule-based flags and score the result
+        """
         # Merge and deduplicate flags
         all_flags = self._merge_red_flags(llm_flags, rule_flags)
         
@@ -156,29 +226,58 @@ class RedFlagDetector:
         """
         Get red flags from Gemini LLM
         """
-        prompt = RED_FLAG_DETECTION_PROMPT.format(
-            validated_claims_json=json.dumps(validated_claims, default=str),
-            seniority_level=seniority_level,
-            role_type=role_type or 'general'
-        )
+        prompt = self._build_red_flag_prompt(validated_claims, seniority_level, role_type)
         
         try:
             response = self.gemini_client.generate_content(
                 prompt,
-                generation_config={
-                    'temperature': 0.2,
-                    'top_p': 0.95,
-                    'max_output_tokens': 4096
-                }
+                generation_config=self.DETECTION_CONFIG
             )
             
             result = json.loads(response.text)
             return result.get('red_flags', [])
             
         except Exception as e:
-            logger.error(f"LLM red flag detection failed: {e}")
+            logger.error("LLM red flag detection failed: %s", e)
+            self.gemini_client.record_fallback()
             return []
             
+    async def _get_llm_red_flags_async(self,
+                                       validated_claims: Dict,
+                                       seniority_level: str,
+                                       role_type: Optional[str]) -> List[Dict]:
+        """
+        Async variant of _get_llm_red_flags
+        """
+        prompt = self._build_red_flag_prompt(validated_claims, seniority_level, role_type)
+        
+        try:
+            response = await self.gemini_client.generate_content_async(
+                prompt,
+                generation_config=self.DETECTION_CONFIG
+            )
+            
+            result = json.loads(response.text)
+            return result.get('red_flags', [])
+            
+        except Exception as e:
+            logger.error("LLM red flag detection failed: %s", e)
+            self.gemini_client.record_fallback()
+            return []
+            
+    def _build_red_flag_prompt(self,
+                               validated_claims: Dict,
+                               seniority_level: str,
+                               role_type: Optional[str]) -> str:
+        """
+        Fill the red flag detection prompt
+        """
+        return RED_FLAG_DETECTION_PROMPT.format(
+            validated_claims_json=json.dumps(validated_claims, default=str),
+            seniority_level=seniority_level,
+            role_type=role_type or 'general'
+        )
+            
     def _detect_rule_based_flags(self,
                                 validated_claims: Dict,
                                 seniority_level: str) -> List[Dict]:
@@ -261,24 +360,17 @@ class RedFlagDetector:
                         
         # Check for senior achievements without senior title
         if seniority_level in ['junior', 'mid'] and claim.get('category') == 'work_experience':
-            senior_patterns = [
-                r'report(?:ed|ing)?\s+to\s+(?:CEO|CTO|VP|President)',
-                r'managed?\s+\d+\+?\s+(?:people|engineers|developers)',
-                r'budget\s+of\s+\$?\d+M\+?'
-            ]
-            
-            for pattern in senior_patterns:
-                if re.search(pattern, claim_text, re.IGNORECASE):
-                    return {
-                        'flag_id': f"senior_claim_{claim['claim_id'][:8]}",
-                        'severity': 'medium',
-                        'category': 'mismatch',
-                        'affected_claims': [claim['claim_id']],
-                        'description': f"Senior-level achievement claimed for {seniority_level} position",
-                        'interview_probe': "Can you walk through the organizational structure and your specific role?",
-                        'requires_proof': True
-                    }
-                    
+            if self.SENIOR_CLAIM_PATTERN.search(claim_text):
+                return {
+                    'flag_id': f"senior_claim_{claim['claim_id'][:8]}",
+                    'severity': 'medium',
+                    'category': 'mismatch',
+                    'affected_claims': [claim['claim_id']],
+                    'description': f"Senior-level achievement claimed for {seniority_level} position",
+                    'interview_probe': "Can you walk through the organizational structure and your specific role?",
+                    'requires_proof': True
+                }
+                
         return None
         
     def _check_sole_credit(self, claim: Dict) -> Optional[Dict]:
@@ -408,7 +500,7 @@ class RedFlagDetector:
         claim_text_lower = claim_text.lower()
 
         # Count buzzwords (count occurrences, not just presence)
-        buzzword_count = sum(claim_text_lower.count(buzz) for buzz in self.BUZZWORDS)
+        buzzword_count = len(self.BUZZWORD_PATTERN.findall(claim_text_lower))
         word_count = len(claim_text.split())
 
         if word_count > 0:
@@ -426,20 +518,19 @@ class RedFlagDetector:
                 }
                 
         # Check for vague technical claims
-        for pattern in self.VAGUE_TECH_CLAIMS:
-            if re.search(pattern, claim_text_lower):
-                # Check if lacks specifics
-                if not claim.get('quantifiable_metrics') and not claim.get('links_artifacts'):
-                    return {
-                        'flag_id': f"vague_tech_{claim['claim_id'][:8]}",
-                        'severity': 'low',
-                        'category': 'vague',
-                        'affected_claims': [claim['claim_id']],
-                        'description': f"Vague technical claim without specifics",
-                        'interview_probe': "What was your specific contribution and technical approach?",
-                        'requires_proof': False
-                    }
-                    
+        if self.VAGUE_TECH_PATTERN.search(claim_text_lower):
+            # Check if lacks specifics
+            if not claim.get('quantifiable_metrics') and not claim.get('links_artifacts'):
+                return {
+                    'flag_id': f"vague_tech_{claim['claim_id'][:8]}",
+                    'severity': 'low',
+                    'category': 'vague',
+                    'affected_claims': [claim['claim_id']],
+                    'description': f"Vague technical claim without specifics",
+                    'interview_probe': "What was your specific contribution and technical approach?",
+                    'requires_proof': False
+                }
+                
         return None
         
     def _check_overclaiming(self, claim: Dict, all_claims: List[Dict]) -> Optional[Dict]:
@@ -638,13 +729,18 @@ class RedFlagDetector:
                 all_flags.append(flag)
                 seen_descriptions.add(key)
                 
+        # Fill missing fields once so consumers can index flags directly
+        for flag in all_flags:
+            for field, default in self.RED_FLAG_DEFAULTS.items():
+                flag.setdefault(field, default)
+                
         # Apply strictness multiplier properly
         multiplier = self.severity_multipliers.get(self.strictness_level, 1.0)
 
         severity_order = ['low', 'medium', 'high', 'critical']
 
         for flag in all_flags:
-            current_severity = flag.get('severity', 'medium')
+            current_severity = flag['severity']
 
             # Skip if severity not recognized
             if current_severity not in severity_order:
@@ -736,7 +832,7 @@ class RedFlagDetector:
         if claims:
             total_text = ' '.join(c.get('claim_text', '') for c in claims)
             word_count = len(total_text.split())
-            buzzword_count = sum(total_text.lower().count(buzz) for buzz in self.BUZZWORDS)
+            buzzword_count = len(self.BUZZWORD_PATTERN.findall(total_text.lower()))
             buzzword_density = buzzword_count / word_count if word_count > 0 else 0
             
             # Apply penalty if exceeds threshold
@@ -8,16 +8,72 @@ import csv
 import io
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
-import pandas as pd
 import logging
+from jinja2 import Environment, select_autoescape
+
+# Optional fast JSON encoder
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; autoescape keeps LLM-generated flag text from injecting markup
+_JINJA_ENV = Environment(autoescape=select_autoescape(['html']))
+
+_HTML_REPORT_TEMPLATE = _JINJA_ENV.from_string("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Resume Verification Report</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                .header { background: #4a90e2; color: white; padding: 20px; }
+                .score { font-size: 36px; font-weight: bold; }
+                .card { background: #f5f5f5; padding: 15px; margin: 10px 0; }
+                .red-flag { background: #ffebee; border-left: 4px solid #f44336; padding: 10px; margin: 5px 0; }
+                table { width: 100%; border-collapse: collapse; }
+                th, td { padding: 10px; text-align: left; border-bottom: 1px solid #ddd; }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>Resume Verification Report</h1>
+                <p>Generated: {{ generated }}</p>
+            </div>
+            
+            <div class="card">
+                <h2>Summary</h2>
+                <div class="score">{{ '%.0f' | format(results.final_score | default(0)) }}/100</div>
+                <p>Risk Level: {{ results.risk_assessment | default('Unknown') | upper }}</p>
+                <p>Total Claims: {{ results.total_claims | default(0) }}</p>
+                <p>Verified: {{ results.verified_claims | default(0) }}</p>
+                <p>Red Flags: {{ results.total_red_flags | default(0) }}</p>
+            </div>
+            
+            <div class="card">
+                <h2>Red Flags</h2>
+                {% for flag in (results.red_flags or [])[:10] %}<div class="red-flag"><strong>[{{ flag.severity | default('') | upper }}]</strong> {{ flag.description | default('No description') }}</div>{% else %}<p>No red flags detected</p>{% endfor %}
+            </div>
+            
+            <div class="card">
+                <h2>Recommendation</h2>
+                <p>{{ results.recommendation | default('No recommendation available') }}</p>
+            </div>
+        </body>
+        </html>
+        """)
+
 class ReportGenerator:
     """
     Generate comprehensive reports with multiple export formats
     """
     
+    # Claim fields written to the CSV report
+    CSV_COLUMNS = ('claim_id', 'claim_text', 'category', 'verifiability_level', 'evidence_present')
+    
     def __init__(self):
         """Initialize report generator"""
         self.styles = {}
@@ -78,87 +134,42 @@ class ReportGenerator:
         output = io.StringIO()
         
         if results.get('claims'):
-            # Create DataFrame from claims
-            claims_data = []
+            # Write claim rows straight to the buffer
+            writer = csv.writer(output, lineterminator='\n')
+            writer.writerow(self.CSV_COLUMNS)
             for claim in results['claims'][:100]:  # Limit to 100
-                claims_data.append({
-                    'claim_id': claim.get('claim_id', ''),
-                    'claim_text': claim.get('claim_text', ''),
-                    'category': claim.get('category', ''),
-                    'verifiability_level': claim.get('verifiability_level', ''),
-                    'evidence_present': claim.get('evidence_present', '')
-                })
-            
-            df = pd.DataFrame(claims_data)
-            df.to_csv(output, index=False)
+                writer.writerow([claim.get(column, '') for column in self.CSV_COLUMNS])
         
         return output.getvalue()
     
     def _generate_json_report(self, results: Dict[str, Any]) -> str:
         """Generate JSON report"""
+        if HAS_ORJSON:
+            # orjson handles dicts, lists and datetimes natively, so only the
+            # leftover objects go through _json_default instead of a full
+            # _clean_for_json copy of the results
+            return orjson.dumps(
+                results,
+                default=self._json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        
         # Clean results for JSON serialization
         clean_results = self._clean_for_json(results)
         return json.dumps(clean_results, indent=2, default=str)
+        
+    def _json_default(self, obj: Any) -> Any:
+        """orjson fallback for objects it cannot encode, matching _clean_for_json"""
+        if hasattr(obj, '__dict__'):
+            return obj.__dict__
+        return str(obj)
     
     def _generate_html_report(self, results: Dict[str, Any]) -> str:
         """Generate HTML report"""
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Resume Verification Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .header {{ background: #4a90e2; color: white; padding: 20px; }}
-                .score {{ font-size: 36px; font-weight: bold; }}
-                .card {{ background: #f5f5f5; padding: 15px; margin: 10px 0; }}
-                .red-flag {{ background: #ffebee; border-left: 4px solid #f44336; padding: 10px; margin: 5px 0; }}
-                table {{ width: 100%; border-collapse: collapse; }}
-                th, td {{ padding: 10px; text-align: left; border-bottom: 1px solid #ddd; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Resume Verification Report</h1>
-                <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
-            </div>
-            
-            <div class="card">
-                <h2>Summary</h2>
-                <div class="score">{results.get('final_score', 0):.0f}/100</div>
-                <p>Risk Level: {results.get('risk_assessment', 'Unknown').upper()}</p>
-                <p>Total Claims: {results.get('total_claims', 0)}</p>
-                <p>Verified: {results.get('verified_claims', 0)}</p>
-                <p>Red Flags: {results.get('total_red_flags', 0)}</p>
-            </div>
-            
-            <div class="card">
-                <h2>Red Flags</h2>
-                {self._generate_red_flags_html(results.get('red_flags', []))}
-            </div>
-            
-            <div class="card">
-                <h2>Recommendation</h2>
-                <p>{results.get('recommendation', 'No recommendation available')}</p>
-            </div>
-        </body>
-        </html>
-        """
-        return html
-    
-    def _generate_red_flags_html(self, red_flags: List[Dict]) -> str:
-        """Generate HTML for red flags"""
-        if not red_flags:
-            return "<p>No red flags detected</p>"
-        
-        html = ""
-        for flag in red_flags[:10]:  # Limit to 10
-            html += f'<div class="red-flag">'
-            html += f'<strong>[{flag.get("severity", "").upper()}]</strong> '
-            html += f'{flag.get("description", "No description")}'
-            html += '</div>'
-        
-        return html
+        return _HTML_REPORT_TEMPLATE.render(
+            results=results,
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M')
+        )
     
     def _clean_for_json(self, obj: Any) -> Any:
         """Clean object for JSON serialization"""
@@ -338,7 +338,8 @@ class SOTAChecker:
             return result.get('sota_validations', [])
             
         except Exception as e:
-            logger.error(f"LLM SOTA verification failed: {e}")
+            logger.error("LLM SOTA verification failed: %s", e)
+            self.gemini_client.record_fallback()
             return []
             
     def _extract_metrics(self, text: str) -> Dict[str, float]: